@@ -1140,6 +1140,14 @@ export function ChatView({
           lastThinkingStartedAtRef.current = null;
           finishWaiting();
           break;
+        case "resync":
+          // The server dropped live frames for a slow connection; the persisted history is complete.
+          fetchHistory(server, token, sessionId)
+            .then((history) => setMessages(projectHistoryToMessages(history)))
+            .catch(() => {
+              // keep the partial view; the next reload will catch up
+            });
+          break;
         case "llm_activity":
           setLlmActivity(msg.activity ?? null);
           if (typeof msg.activity?.first_thinking_at === "string") {
@@ -1215,7 +1223,16 @@ export function ChatView({
           break;
       }
     },
-    [applySandboxSnapshot, finalizeThinkingMessages, finishWaiting, onTitleUpdate, refreshSandbox],
+    [
+      applySandboxSnapshot,
+      finalizeThinkingMessages,
+      finishWaiting,
+      onTitleUpdate,
+      refreshSandbox,
+      server,
+      sessionId,
+      token,
+    ],
   );
 
   const onWsDisconnect = useCallback(() => {
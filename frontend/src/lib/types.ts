@@ -274,6 +274,10 @@ export interface Cancelled {
   detail: string;
 }
 
+export interface ResyncRequired {
+  type: "resync";
+}
+
 export interface SessionTitleUpdate {
   type: "session_title";
   title: string;
@@ -305,6 +309,7 @@ export type ServerMessage =
   | CommandResult
   | ErrorMessage
   | Cancelled
+  | ResyncRequired
   | SessionTitleUpdate
   | LlmActivityUpdate
   | StatusUpdate
@@ -27,7 +27,7 @@ from pydantic_ai.messages import (
 )
 from pydantic_ai.usage import UsageLimits
 
-from carapace.agent.tools import create_agent
+from carapace.agent.tools import get_agent
 from carapace.models import Deps
 from carapace.security.context import (
     AgentResponseEntry,
@@ -59,7 +59,7 @@ async def run_agent_turn(
     """
     deps.security.append(UserMessageEntry(content=user_input))
 
-    agent = create_agent(deps)
+    agent = get_agent(deps)
     usage_model_key = deps.agent_model_id
     current_thinking_parts: list[str] = []
     last_thinking = ""
@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import re
 import secrets
+from collections import OrderedDict
 from datetime import date
 from pathlib import Path, PurePosixPath
 from typing import Annotated, Any
@@ -11,11 +12,13 @@ import httpx
 from loguru import logger
 from pydantic import Field
 from pydantic_ai import Agent, DeferredToolRequests, RunContext, ToolDenied
+from pydantic_ai.models import Model
 
 import carapace.security as security
 from carapace.config import load_workspace_file
 from carapace.llm import model_settings_for_config
 from carapace.models import (
+    Config,
     ContextGrant,
     CredentialMetadata,
     Deps,
@@ -35,10 +38,16 @@ from carapace.security.context import (
 from carapace.skills import SkillRegistry
 from carapace.usage import LlmRequestLogCapability
 
+_AGENT_CACHE_SIZE = 64
 _WORKSPACE_ROOT = PurePosixPath("/workspace")
 _SKILLS_ROOT = PurePosixPath("skills")
 _SKILL_PATH_PATTERN = re.compile(r"(?<![\w.-])(?:/workspace/)?skills/(?P<skill>[A-Za-z0-9][A-Za-z0-9._-]*)")
 
+# (agent model id, system prompt) -> (model, config, agent), least recently used first.
+_agent_cache: OrderedDict[tuple[str, str], tuple[Model, Config, Agent[Deps, str | DeferredToolRequests]]] = (
+    OrderedDict()
+)
+
 
 def _normalize_workspace_path(path: str) -> PurePosixPath:
     raw = PurePosixPath(path)
@@ -441,9 +450,33 @@ def build_system_prompt(deps: Deps) -> str:
     return "\n\n---\n\n".join(parts)
 
 
-def create_agent(deps: Deps) -> Agent[Deps, str | DeferredToolRequests]:
+def get_agent(deps: Deps) -> Agent[Deps, str | DeferredToolRequests]:
+    """Return an agent for *deps*, reusing the last one built from the same inputs.
+
+    Tools read everything else from ``ctx.deps`` at run time, so an agent only depends on the
+    model, its settings and the system prompt (which already embeds the session ID and date).
+    Building one registers every tool and generates their schemas, which is worth skipping
+    on each turn.
+    """
     system_prompt = build_system_prompt(deps)
+    key = (deps.agent_model_id, system_prompt)
+    cached = _agent_cache.get(key)
+    if cached is not None and cached[0] is deps.agent_model and cached[1] is deps.config:
+        _agent_cache.move_to_end(key)
+        return cached[2]
+    agent = _create_agent(deps, system_prompt)
+    _agent_cache[key] = (deps.agent_model, deps.config, agent)
+    _agent_cache.move_to_end(key)
+    while len(_agent_cache) > _AGENT_CACHE_SIZE:
+        _agent_cache.popitem(last=False)
+    return agent
+
+
+def create_agent(deps: Deps) -> Agent[Deps, str | DeferredToolRequests]:
+    return _create_agent(deps, build_system_prompt(deps))
+
 
+def _create_agent(deps: Deps, system_prompt: str) -> Agent[Deps, str | DeferredToolRequests]:
     agent: Agent[Deps, str | DeferredToolRequests] = Agent(
         deps.agent_model,
         deps_type=Deps,
@@ -476,10 +509,10 @@ def create_agent(deps: Deps) -> Agent[Deps, str | DeferredToolRequests]:
         registry = SkillRegistry(ctx.deps.knowledge_dir / "skills")
 
         carapace_cfg = registry.get_carapace_config(skill_name)
-        declared_domains = carapace_cfg.network.domains if carapace_cfg else []
-        declared_tunnels = carapace_cfg.network.tunnels if carapace_cfg else []
-        declared_creds = carapace_cfg.credentials if carapace_cfg else []
-        declared_commands = carapace_cfg.commands if carapace_cfg else []
+        declared_domains = list(carapace_cfg.network.domains) if carapace_cfg else []
+        declared_tunnels = list(carapace_cfg.network.tunnels) if carapace_cfg else []
+        declared_creds = list(carapace_cfg.credentials) if carapace_cfg else []
+        declared_commands = list(carapace_cfg.commands) if carapace_cfg else []
         declared_creds_payload = [decl.model_dump(mode="json") for decl in declared_creds]
         declared_tunnels_payload = [decl.model_dump(mode="json") for decl in declared_tunnels]
         declared_commands_payload = [decl.model_dump(mode="json") for decl in declared_commands]
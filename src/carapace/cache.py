@@ -52,7 +52,8 @@ class SessionListCache:
         if redis_cached is not None:
             return redis_cached
 
-        session_infos = loader()
+        # The loader walks every session file on disk; keep that off the event loop.
+        session_infos = await asyncio.to_thread(loader)
         await self._redis_set(cache_key, session_infos)
         return session_infos
 
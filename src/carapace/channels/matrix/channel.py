@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -43,7 +44,7 @@ class MatrixChannel:
         config: MatrixChannelConfig,
         full_config: Config,
         session_mgr: SessionManager,
-        skill_catalog: list[SkillInfo],
+        skill_catalog: Sequence[SkillInfo],
         agent_model: Any,
         sandbox_mgr: SandboxManager,
         engine: SessionEngine,
@@ -150,7 +151,7 @@ class MatrixChannel:
         """Return (access_token, device_id) from persisted file or env var, or ("", None)."""
         if token_file.exists():
             try:
-                stored = MatrixTokenFile.model_validate_json(token_file.read_text())
+                stored = MatrixTokenFile.model_validate_json(token_file.read_bytes())
                 if stored.user_id != self._config.user_id:
                     logger.warning(
                         f"Matrix: persisted token belongs to {stored.user_id!r}, "
@@ -515,7 +516,8 @@ class MatrixChannel:
         if sub:
             self._engine.unsubscribe(old_session_id, sub)
         await self._sandbox_mgr.cleanup_session(old_session_id)
-        new_state = self._session_mgr.create_session(
+        new_state = await asyncio.to_thread(
+            self._session_mgr.create_session,
             "matrix",
             room_id,
             budget=self._engine.config.agent.default_session_budget,
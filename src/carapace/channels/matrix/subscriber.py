@@ -143,6 +143,9 @@ class MatrixSubscriber:
         self._stop_typing()
         # no message needed — handled by the /stop command
 
+    async def on_resync_required(self) -> None:
+        pass  # Matrix keeps its own room history; nothing to reload
+
     async def on_approval_request(self, req: ApprovalRequest) -> None:
         text = format_approval_request(req)
         event_id = await self._channel._send_text(self._room_id, text)
@@ -3,8 +3,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-import yaml
-
+from carapace import yaml_io
 from carapace.models import Config
 
 
@@ -45,7 +44,7 @@ def load_config(data_dir: Path | None = None) -> Config:
     config_path = get_config_path() if data_dir is None else data_dir / "config.yaml"
     if config_path.exists():
         with open(config_path) as f:
-            raw = yaml.safe_load(f) or {}
+            raw = yaml_io.safe_load(f) or {}
         return Config.model_validate(raw)
     return Config()
 
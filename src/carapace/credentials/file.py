@@ -3,9 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
 from loguru import logger
 
+from carapace import yaml_io
 from carapace.credentials.protocol import is_exposed, require_exposed
 from carapace.models import CredentialMetadata, FileCredentialBackendConfig
 
@@ -68,7 +68,7 @@ class FileVaultBackend:
                 self._secrets[key] = _Secret(name=key, value=value)
 
     def _load_yaml(self, path: Path) -> None:
-        data = yaml.safe_load(path.read_text())
+        data = yaml_io.safe_load(path.read_text())
         if not isinstance(data, list):
             logger.warning(f"File backend '{self._name}': YAML file must contain a list of entries")
             return
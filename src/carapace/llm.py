@@ -20,6 +20,8 @@ from carapace.models import Config, agent_available_model_entries
 
 ThinkingSetting = bool | Literal["minimal", "low", "medium", "high", "xhigh"]
 
+_shared_retry_client: AsyncClient | None = None
+
 
 def retry_http_client() -> AsyncClient:
     transport = AsyncTenacityTransport(
@@ -34,9 +36,24 @@ def retry_http_client() -> AsyncClient:
     return AsyncClient(transport=transport, timeout=Timeout(connect=15.0, read=300.0, write=15.0, pool=60.0))
 
 
+def shared_retry_http_client() -> AsyncClient:
+    """Process-wide retry client, so every model built here reuses one connection pool."""
+    global _shared_retry_client
+    if _shared_retry_client is None or _shared_retry_client.is_closed:
+        _shared_retry_client = retry_http_client()
+    return _shared_retry_client
+
+
+async def close_shared_retry_http_client() -> None:
+    global _shared_retry_client
+    client, _shared_retry_client = _shared_retry_client, None
+    if client is not None:
+        await client.aclose()
+
+
 def infer_model_with_retry_transport(model_name: str) -> Model:
     """Create a Pydantic AI model with retry-capable HTTP transport."""
-    http_client = retry_http_client()
+    http_client = shared_retry_http_client()
 
     def _provider_factory(name: str) -> Provider:
         if name.startswith("gateway/"):
@@ -94,7 +111,7 @@ def make_model_factory(config: Config) -> Callable[[str], Model]:
             if entry.api_key is not None:
                 api_key = entry.api_key.resolve().get_secret_value()
             if entry.base_url is not None or entry.api_key is not None:
-                http_client = retry_http_client()
+                http_client = shared_retry_http_client()
                 provider = OpenAIProvider(
                     base_url=entry.base_url,
                     api_key=api_key,
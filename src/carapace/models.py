@@ -7,9 +7,19 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated, Any, Literal, Protocol, runtime_checkable
 
-from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_serializer, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SecretStr,
+    field_serializer,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 from pydantic_ai.models import Model
 from pydantic_ai.usage import UsageLimits
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -135,6 +145,36 @@ class SessionState(BaseModel):
         )
 
 
+class SessionSummary(BaseModel):
+    """The subset of ``SessionState`` needed to list and look up sessions."""
+
+    session_id: str
+    channel_type: str
+    channel_ref: str | None = None
+    title: str | None = None
+    attributes: SessionAttributes
+    created_at: datetime
+    last_active: datetime
+    knowledge_last_committed_at: datetime | None = None
+    knowledge_last_archive_path: str | None = None
+    knowledge_last_commit_trigger: str | None = None
+
+    @classmethod
+    def from_state(cls, state: SessionState) -> SessionSummary:
+        return cls.model_construct(
+            session_id=state.session_id,
+            channel_type=state.channel_type,
+            channel_ref=state.channel_ref,
+            title=state.title,
+            attributes=state.attributes.model_copy(),
+            created_at=state.created_at,
+            last_active=state.last_active,
+            knowledge_last_committed_at=state.knowledge_last_committed_at,
+            knowledge_last_archive_path=state.knowledge_last_archive_path,
+            knowledge_last_commit_trigger=state.knowledge_last_commit_trigger,
+        )
+
+
 # --- Secrets ---
 
 
@@ -506,6 +546,8 @@ class ToolResult:
 class SkillCredentialDecl(BaseModel):
     """A credential requirement declared in a skill's carapace metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     vault_path: str
     description: str = ""
     env_var: str | None = None
@@ -516,8 +558,10 @@ class SkillCredentialDecl(BaseModel):
 
 
 class SkillNetworkConfig(BaseModel):
-    domains: list[str] = []
-    tunnels: list[NetworkTunnel] = []
+    model_config = ConfigDict(frozen=True)
+
+    domains: tuple[str, ...] = ()
+    tunnels: tuple[NetworkTunnel, ...] = ()
 
     @model_validator(mode="after")
     def _validate_tunnels(self) -> SkillNetworkConfig:
@@ -542,34 +586,54 @@ _SKILL_COMMAND_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
 class SkillCommandDecl(BaseModel):
     """A command alias declared in a skill's carapace metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     command: str
 
-    @model_validator(mode="after")
-    def _validate(self) -> SkillCommandDecl:
-        if not _SKILL_COMMAND_NAME_RE.match(self.name):
+    @field_validator("name")
+    @classmethod
+    def _validate_name(cls, name: str) -> str:
+        if not _SKILL_COMMAND_NAME_RE.match(name):
             raise ValueError(
                 "skill command name must start with an alphanumeric character and contain only letters, "
                 "numbers, dots, underscores, or hyphens"
             )
+        return name
 
-        command = self.command.strip()
+    @field_validator("command")
+    @classmethod
+    def _validate_command(cls, command: str) -> str:
+        command = command.strip()
         if not command:
             raise ValueError("skill command must not be empty")
         if "\n" in command or "\r" in command:
             raise ValueError("skill command must be a single line")
-
-        self.command = command
-        return self
+        return command
 
 
 class SkillCarapaceConfig(BaseModel):
-    """Parsed carapace config declared inline in SKILL.md or in ``carapace.yaml``."""
+    """Parsed carapace config declared inline in SKILL.md or in ``carapace.yaml``.
+
+    Immutable all the way down (frozen models, tuples, a read-only ``hints`` view)
+    because SkillRegistry hands the same validated instance to every caller.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     network: SkillNetworkConfig = SkillNetworkConfig()
-    credentials: list[SkillCredentialDecl] = []
-    commands: list[SkillCommandDecl] = []
-    hints: dict[str, str] = {}
+    credentials: tuple[SkillCredentialDecl, ...] = ()
+    commands: tuple[SkillCommandDecl, ...] = ()
+    hints: Mapping[str, str] = Field(default_factory=dict, validate_default=True)
+
+    @field_validator("hints", mode="after")
+    @classmethod
+    def _freeze_hints(cls, hints: Mapping[str, str]) -> Mapping[str, str]:
+        return MappingProxyType(dict(hints))
+
+    @field_serializer("hints")
+    def _serialize_hints(self, hints: Mapping[str, str]) -> dict[str, str]:
+        return dict(hints)
 
     @model_validator(mode="after")
     def _validate_commands(self) -> SkillCarapaceConfig:
@@ -642,7 +706,7 @@ class Deps(BaseModel):
     security: SessionSecurity
     sentinel: Sentinel
     git_store: GitStore
-    skill_catalog: list[SkillInfo] = []
+    skill_catalog: tuple[SkillInfo, ...] = ()
     activated_skills: list[str] = []
     agent_model: Model
     agent_model_id: str = Field(
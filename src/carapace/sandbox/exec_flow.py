@@ -13,6 +13,8 @@ from carapace.sandbox.runtime import ContainerGoneError, ContainerRuntime, ExecR
 from carapace.sandbox.session_lifecycle import SessionContainer
 from carapace.security.context import ApprovalSource, ApprovalVerdict
 
+_BYPASS_DOMAINS = frozenset({"*"})
+
 type DomainApprovalCallback = Callable[[str, str], Awaitable[bool]]
 type DomainNotifyCallback = Callable[[str, str, ApprovalSource | None, ApprovalVerdict | None, str | None], None]
 type AfterExecCredentialNotify = Callable[[], None]
@@ -222,22 +224,24 @@ class SandboxExecCoordinator:
             entries.append({"domain": domain, "scope": "this exec only"})
         return entries
 
-    def get_effective_domains(self, session_id: str) -> set[str]:
+    def get_effective_domains(self, session_id: str) -> frozenset[str]:
+        # Called by the proxy on every request: build the union once, as a frozenset that
+        # domain_in_allowlist can use as its compiled-pattern cache key without copying.
         if session_id in self._state.proxy_bypass_sessions:
-            return {"*"}
-        domains = set(self._state.allowed_domains.get(session_id, set()))
-        domains.update(self._state.exec_temp_domains.get(session_id, set()))
-        return domains
+            return _BYPASS_DOMAINS
+        return frozenset().union(
+            self._state.allowed_domains.get(session_id, ()),
+            self._state.exec_temp_domains.get(session_id, ()),
+        )
 
     def get_current_contexts(self, session_id: str) -> list[str]:
         return self._state.session_current_contexts.get(session_id, [])
 
     def is_domain_skill_granted(self, session_id: str, domain: str) -> bool:
-        from carapace.sandbox.proxy import domain_matches
+        from carapace.sandbox.proxy import domain_in_allowlist
 
         skill_domains = self._state.exec_context_skill_domains.get(session_id, set())
-        domain_lower = domain.lower()
-        return any(domain_matches(domain_lower, pattern.lower()) for pattern in skill_domains)
+        return domain_in_allowlist(domain, skill_domains)
 
     def is_domain_bypass(self, session_id: str) -> bool:
         return session_id in self._state.proxy_bypass_sessions
@@ -210,7 +210,6 @@ class SandboxManager:
         self._proxy_port = proxy_port
         self._sandbox_port = sandbox_port
         self._sessions: dict[str, SessionContainer] = {}
-        self._token_to_session: dict[str, str] = {}
         self._session_tokens: dict[str, str] = {}
         self._allowed_domains: dict[str, set[str]] = {}
         self._exec_temp_domains: dict[str, set[str]] = {}  # session_id -> domains, cleared after each exec
@@ -235,7 +234,6 @@ class SandboxManager:
             runtime=runtime,
             state=SandboxSessionLifecycleState(
                 sessions=self._sessions,
-                token_to_session=self._token_to_session,
                 session_tokens=self._session_tokens,
                 allowed_domains=self._allowed_domains,
                 exec_temp_domains=self._exec_temp_domains,
@@ -844,6 +842,9 @@ class SandboxManager:
     async def cleanup_idle(self) -> None:
         await self._session_lifecycle.cleanup_idle(self.cleanup_session)
 
+    def seconds_until_idle_expiry(self) -> float:
+        return self._session_lifecycle.seconds_until_idle_expiry()
+
     async def cleanup_all(self) -> None:
         await self._session_lifecycle.cleanup_all(self.cleanup_session)
 
@@ -868,7 +869,7 @@ class SandboxManager:
     def get_domain_info(self, session_id: str) -> list[dict[str, str]]:
         return self._exec_coordinator.get_domain_info(session_id)
 
-    def get_effective_domains(self, session_id: str) -> set[str]:
+    def get_effective_domains(self, session_id: str) -> frozenset[str]:
         return self._exec_coordinator.get_effective_domains(session_id)
 
     # ------------------------------------------------------------------
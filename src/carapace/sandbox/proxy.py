@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
 import contextlib
 import ssl
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
 from urllib.parse import urlsplit
 
 from loguru import logger
@@ -21,6 +23,9 @@ _FORBIDDEN_RESPONSE = (
 )
 _BAD_REQUEST = b"HTTP/1.1 400 Bad Request\r\nContent-Length: 11\r\nConnection: close\r\n\r\nBad Request"
 _RELAY_BUF = 32 * 1024
+_STOP_GRACE_SECONDS = 0.5
+_PROXY_AUTH_PREFIX = b"proxy-authorization:"
+_PROXY_AUTH_PREFIX_LEN = len(_PROXY_AUTH_PREFIX)
 
 
 def domain_matches(domain: str, pattern: str) -> bool:
@@ -31,11 +36,58 @@ def domain_matches(domain: str, pattern: str) -> bool:
                  ``"a.b.example.com"`` but **not** ``"example.com"`` itself.
     """
     if pattern.startswith("*."):
-        suffix = pattern[1:]  # ".example.com"
-        return domain.endswith(suffix) and domain != suffix.lstrip(".")
+        # ".example.com" is longer than the apex, so the suffix check alone excludes it.
+        return domain.endswith(pattern[1:])
     return domain == pattern
 
 
+# A sandbox sends the same credentials on every request, so the decoded pair is memoised.
+@lru_cache(maxsize=256)
+def _decode_basic_credentials(encoded: bytes) -> tuple[str, str] | None:
+    try:
+        decoded = binascii.a2b_base64(encoded).decode()
+    except ValueError:  # binascii.Error / UnicodeDecodeError
+        return None
+    username, _, password = decoded.partition(":")
+    if not username or not password:
+        return None
+    return username, password
+
+
+@lru_cache(maxsize=256)
+def _compile_domain_patterns(patterns: frozenset[str]) -> tuple[frozenset[str], frozenset[str]]:
+    """Split *patterns* into lowercased exact domains and wildcard suffixes (``*.example.com`` → ``example.com``)."""
+    exact: set[str] = set()
+    suffixes: set[str] = set()
+    for pattern in patterns:
+        pattern = pattern.lower()
+        if pattern.startswith("*."):
+            suffixes.add(pattern[2:])
+        else:
+            exact.add(pattern)
+    return frozenset(exact), frozenset(suffixes)
+
+
+def domain_in_allowlist(domain: str, patterns: Iterable[str]) -> bool:
+    """Case-insensitive ``any(domain_matches(domain, p) for p in patterns)`` using set lookups.
+
+    A wildcard matches at any depth, so each parent suffix of *domain* is looked up once
+    instead of comparing against every pattern.
+    """
+    exact, suffixes = _compile_domain_patterns(frozenset(patterns))
+    domain = domain.lower()
+    if domain in exact:
+        return True
+    if not suffixes:
+        return False
+    dot = domain.find(".")
+    while dot >= 0:
+        if domain[dot + 1 :] in suffixes:
+            return True
+        dot = domain.find(".", dot + 1)
+    return False
+
+
 class ProxyServer:
     """Async HTTP forward-proxy with per-session domain allowlists.
 
@@ -46,7 +98,7 @@ class ProxyServer:
     def __init__(
         self,
         verify_session_token: Callable[[str, str], bool],
-        get_allowed_domains: Callable[[str], set[str]],
+        get_allowed_domains: Callable[[str], AbstractSet[str]],
         request_approval: Callable[[str, str], Awaitable[bool]] | None = None,
         notify_domain_access: Callable[[str, str, bool], None] | None = None,
         host: str = "0.0.0.0",
@@ -59,6 +111,7 @@ class ProxyServer:
         self._host = host
         self._port = port
         self._server: asyncio.Server | None = None
+        self._client_writers: set[asyncio.StreamWriter] = set()
 
     async def start(self) -> None:
         self._server = await asyncio.start_server(
@@ -71,7 +124,17 @@ class ProxyServer:
     async def stop(self) -> None:
         if self._server:
             self._server.close()
-            await self._server.wait_closed()
+            # wait_closed() also waits for open client connections, and CONNECT tunnels can stay up
+            # for a long time; don't let them hold up shutdown. Whatever is still open after the
+            # grace period is aborted so a stopped proxy no longer relays any egress.
+            try:
+                await asyncio.wait_for(self._server.wait_closed(), timeout=_STOP_GRACE_SECONDS)
+            except TimeoutError:
+                writers = list(self._client_writers)
+                for writer in writers:
+                    writer.transport.abort()
+                logger.info(f"Proxy server stopped, aborted {len(writers)} open client connection(s)")
+                return
             logger.info("Proxy server stopped")
 
     # ------------------------------------------------------------------
@@ -83,6 +146,7 @@ class ProxyServer:
     ) -> None:
         peer = writer.get_extra_info("peername")
         client_ip = peer[0] if peer else "unknown"
+        self._client_writers.add(writer)
 
         try:
             request_line = await asyncio.wait_for(reader.readline(), timeout=30)
@@ -104,7 +168,7 @@ class ProxyServer:
                 if hdr in (b"\r\n", b"\n", b""):
                     break
                 raw_headers.append(hdr)
-                if hdr.lower().startswith(b"proxy-authorization:"):
+                if hdr[:_PROXY_AUTH_PREFIX_LEN].lower() == _PROXY_AUTH_PREFIX:
                     proxy_auth = self._extract_basic_credentials(hdr)
 
             session_id: str | None = None
@@ -145,6 +209,7 @@ class ProxyServer:
         except Exception as exc:
             logger.debug(f"Proxy: error handling {client_ip}: {exc}")
         finally:
+            self._client_writers.discard(writer)
             try:
                 writer.close()
                 await writer.wait_closed()
@@ -154,18 +219,13 @@ class ProxyServer:
     @staticmethod
     def _extract_basic_credentials(header_line: bytes) -> tuple[str, str] | None:
         """Extract ``(session_id, token)`` from a ``Proxy-Authorization: Basic ...`` header."""
-        try:
-            _, value = header_line.split(b":", 1)
-            scheme, _, encoded = value.strip().partition(b" ")
-            if scheme.lower() != b"basic":
-                return None
-            decoded = base64.b64decode(encoded).decode()
-            username, _, password = decoded.partition(":")
-            if not username or not password:
-                return None
-            return username, password
-        except Exception:
+        _, sep, value = header_line.partition(b":")
+        if not sep:
+            return None
+        scheme, _, encoded = value.strip().partition(b" ")
+        if scheme.lower() != b"basic":
             return None
+        return _decode_basic_credentials(encoded)
 
     # ------------------------------------------------------------------
     # CONNECT (HTTPS tunnelling)
@@ -366,8 +426,7 @@ class ProxyServer:
         allowed = self._get_domains(session_id)
         if "*" in allowed:
             return True
-        domain = domain.lower()
-        return any(domain_matches(domain, p.lower()) for p in allowed)
+        return domain_in_allowlist(domain, allowed)
 
     # ------------------------------------------------------------------
     # URL / host parsing helpers
@@ -27,7 +27,6 @@ class SessionContainer(BaseModel):
 @dataclass
 class SandboxSessionLifecycleState:
     sessions: dict[str, SessionContainer]
-    token_to_session: dict[str, str]
     session_tokens: dict[str, str]
     allowed_domains: dict[str, set[str]]
     exec_temp_domains: dict[str, set[str]]
@@ -88,7 +87,6 @@ class SandboxSessionLifecycle:
             logger.warning(f"Ignoring empty persisted token for session {session_id}")
             return None
         self._state.session_tokens[session_id] = token
-        self._state.token_to_session[token] = session_id
         logger.debug(f"Restored token for session {session_id} from disk")
         return token
 
@@ -107,7 +105,6 @@ class SandboxSessionLifecycle:
         token_path.parent.mkdir(parents=True, exist_ok=True)
         token_path.write_text(token)
         self._state.session_tokens[session_id] = token
-        self._state.token_to_session[token] = session_id
         return token
 
     def sandbox_name(self, session_id: str) -> str:
@@ -313,9 +310,7 @@ class SandboxSessionLifecycle:
         """Roll back all in-memory tracking for a session."""
         self._state.sessions.pop(session_id, None)
         self._state.stashed_session_env.pop(session_id, None)
-        token = self._state.session_tokens.pop(session_id, None)
-        if token:
-            self._state.token_to_session.pop(token, None)
+        self._state.session_tokens.pop(session_id, None)
         self._state.allowed_domains.pop(session_id, None)
         self._state.exec_temp_domains.pop(session_id, None)
         self._state.exec_context_skill_domains.pop(session_id, None)
@@ -344,9 +339,7 @@ class SandboxSessionLifecycle:
                 await self._runtime.destroy_sandbox(session_id, sandbox_name, existing_id)
                 logger.info(f"Destroyed orphaned sandbox for session {session_id}")
 
-        token = self._state.session_tokens.pop(session_id, None)
-        if token:
-            self._state.token_to_session.pop(token, None)
+        self._state.session_tokens.pop(session_id, None)
         self._state.allowed_domains.pop(session_id, None)
         self._state.exec_temp_domains.pop(session_id, None)
         self._state.exec_context_skill_domains.pop(session_id, None)
@@ -386,6 +379,17 @@ class SandboxSessionLifecycle:
         now = time.time()
         return [sid for sid, sc in self._state.sessions.items() if now - sc.last_used > self._idle_timeout]
 
+    def seconds_until_idle_expiry(self) -> float:
+        """Seconds until the least recently used container crosses the idle timeout.
+
+        Without containers this is the full timeout: anything created meanwhile
+        cannot expire any sooner than that.
+        """
+        if not self._state.sessions:
+            return float(self._idle_timeout)
+        oldest = min(sc.last_used for sc in self._state.sessions.values())
+        return max(oldest + self._idle_timeout - time.time(), 0.0)
+
     async def cleanup_idle(self, cleanup_fn: Callable[[str], Awaitable[None]] | None = None) -> None:
         """Remove containers that have been idle longer than the timeout."""
         to_remove = self._idle_session_ids()
@@ -423,6 +427,7 @@ class SandboxSessionLifecycle:
 
     def verify_session_token(self, session_id: str, token: str) -> bool:
         """Return True if *token* is valid for *session_id*."""
-        if session_id not in self._state.session_tokens:
-            self._load_persisted_token(session_id)
-        return self._state.token_to_session.get(token) == session_id
+        expected = self._state.session_tokens.get(session_id) or self._load_persisted_token(session_id)
+        # Keyed by session, so the client-supplied token is never hashed into a lookup table,
+        # and compared in constant time (as bytes: compare_digest rejects non-ASCII str).
+        return expected is not None and secrets.compare_digest(expected.encode(), token.encode())
@@ -4,9 +4,9 @@ from datetime import datetime
 from pathlib import Path
 from threading import RLock
 
-import yaml
 from pydantic import BaseModel
 
+from carapace import yaml_io
 from carapace.sandbox.runtime import SandboxRuntimeKind, SandboxStatus
 
 
@@ -44,7 +44,7 @@ def load_sandbox_snapshot(path: Path) -> SessionSandboxSnapshot | None:
             return snapshot.model_copy(deep=True) if snapshot is not None else None
 
     with open(resolved_path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml_io.safe_load(f)
     if not raw:
         with _snapshot_cache_lock:
             _snapshot_cache[resolved_path] = (stat.st_mtime_ns, stat.st_size, None)
@@ -60,7 +60,7 @@ def save_sandbox_snapshot(path: Path, snapshot: SessionSandboxSnapshot) -> None:
     resolved_path = path.resolve()
     resolved_path.parent.mkdir(parents=True, exist_ok=True)
     with open(resolved_path, "w") as f:
-        yaml.dump(snapshot.model_dump(mode="json"), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml_io.dump(snapshot.model_dump(mode="json"), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
     stat = resolved_path.stat()
     with _snapshot_cache_lock:
         _snapshot_cache[resolved_path] = (stat.st_mtime_ns, stat.st_size, snapshot.model_copy(deep=True))
@@ -7,10 +7,11 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
-import yaml
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from carapace import yaml_io
+
 
 class SecurityDeniedError(Exception):
     """Raised when the sentinel denies a tool call."""
@@ -441,7 +442,9 @@ class SessionSecurity:
         audit_path = self._audit_dir / "audit.yaml"
         with open(audit_path, "a") as f:
             f.write("---\n")
-            yaml.dump(entry.model_dump(mode="json"), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            yaml_io.dump(
+                entry.model_dump(mode="json"), f, default_flow_style=False, allow_unicode=True, sort_keys=False
+            )
 
     def set_user_escalation_callback(
         self,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hmac
 import logging  # stdlib logging used only for _InterceptHandler → loguru bridge
 import os
 import sys
@@ -28,10 +29,11 @@ from fastapi import (
     status,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from genai_prices import UpdatePrices
 from loguru import logger
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, TypeAdapter, model_validator
 from pydantic_ai.exceptions import UsageLimitExceeded
 
 from carapace.auth import get_token
@@ -41,8 +43,8 @@ from carapace.config import _resolve_data_dir, _resolve_knowledge_dir, get_confi
 from carapace.credentials import CredentialRegistry, build_credential_registry
 from carapace.git.http import GitHttpHandler
 from carapace.git.store import GitStore
-from carapace.llm import make_model_factory
-from carapace.models import Config, SessionAttributes, SessionState, ToolResult
+from carapace.llm import close_shared_retry_http_client, make_model_factory
+from carapace.models import Config, SessionAttributes, SessionState, SessionSummary, ToolResult
 from carapace.sandbox.manager import SandboxManager
 from carapace.sandbox.proxy import ProxyServer
 from carapace.sandbox.runtime import ContainerRuntime
@@ -53,6 +55,7 @@ from carapace.session.archive import SessionArchiveService
 from carapace.skills import SkillRegistry
 from carapace.usage import LlmRequestState, SessionBudgetExceededError
 from carapace.ws_models import (
+    SERVER_ENVELOPE_ADAPTER,
     SLASH_COMMANDS,
     ApprovalRequest,
     ApprovalResponse,
@@ -68,6 +71,7 @@ from carapace.ws_models import (
     LlmActivity,
     LlmActivityUpdate,
     ResetToTurnRequest,
+    ResyncRequired,
     RetryLatestTurnRequest,
     ServerEnvelope,
     SessionTitleUpdate,
@@ -79,7 +83,7 @@ from carapace.ws_models import (
     TurnUsage,
     UserMessage,
     UserMessageNotification,
-    parse_client_message,
+    parse_client_frame,
 )
 
 load_dotenv()
@@ -95,6 +99,15 @@ _session_archive: SessionArchiveService
 _session_list_cache: SessionListCache
 
 _SESSION_COMMIT_SWEEP_SECONDS = 15 * 60
+# Floor between idle sweeps, so a container that exactly hits (or fails) cleanup cannot spin the loop.
+_IDLE_CLEANUP_MIN_WAIT_SECONDS = 1.0
+
+# uvicorn[standard] ships httptools and (except on Windows) uvloop. Pin them so a broken
+# install fails at startup instead of silently falling back to asyncio + h11.
+_UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+_UVICORN_HTTP = "httptools"
+
+_STDLIB_LOGGING_FILE = logging.__file__
 
 
 def _create_sandbox_runtime(config: Config, data_dir: Path) -> ContainerRuntime:
@@ -131,9 +144,11 @@ def _create_sandbox_runtime(config: Config, data_dir: Path) -> ContainerRuntime:
 
 
 async def _idle_cleanup_loop(sandbox_mgr: SandboxManager) -> None:
-    """Periodically clean up idle sandbox containers."""
+    """Clean up idle sandbox containers as soon as the oldest one reaches its idle deadline."""
     while True:
-        await asyncio.sleep(60)
+        # Touching a container only pushes its deadline later, so waking at the current
+        # earliest deadline never misses one; an early wake just recomputes.
+        await asyncio.sleep(max(sandbox_mgr.seconds_until_idle_expiry(), _IDLE_CLEANUP_MIN_WAIT_SECONDS))
         try:
             await sandbox_mgr.cleanup_idle()
         except Exception as exc:
@@ -337,6 +352,7 @@ async def lifespan(app: FastAPI):
             port=_config.server.sandbox_port,
             log_level=_config.carapace.log_level,
             log_config=None,
+            http=_UVICORN_HTTP,
         )
     )
     sandbox_task = asyncio.create_task(sandbox_server.serve())
@@ -350,6 +366,7 @@ async def lifespan(app: FastAPI):
             port=_config.server.internal_port,
             log_level=_config.carapace.log_level,
             log_config=None,
+            http=_UVICORN_HTTP,
         )
     )
     internal_task = asyncio.create_task(internal_server.serve())
@@ -402,6 +419,7 @@ async def lifespan(app: FastAPI):
     await _credential_registry.close()
     await _sandbox_mgr.cleanup_all()
     await _session_list_cache.close()
+    await close_shared_retry_http_client()
     price_updater.stop()
     logger.info("Shutdown complete")
 
@@ -417,18 +435,26 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_config.server.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the web UI actually sends, so preflights are answered from fixed lists
+    # instead of echoing back arbitrary requested methods and headers.
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
+# Session lists and histories are large, repetitive JSON; small responses are not worth compressing.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 _bearer_scheme = HTTPBearer()
 
 
+def _token_matches(candidate: str, expected: str) -> bool:
+    """Constant-time token comparison, so response timing does not leak a matching prefix."""
+    return hmac.compare_digest(candidate.encode(), expected.encode())
+
+
 async def _verify_token(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(_bearer_scheme)],
 ) -> str:
-    expected = get_token()
-    if credentials.credentials != expected:
+    if not _token_matches(credentials.credentials, get_token()):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     return credentials.credentials
 
@@ -438,10 +464,10 @@ async def _verify_ws_token(
     token: Annotated[str | None, Query()] = None,
 ) -> str:
     expected = get_token()
-    if token and token == expected:
+    if token and _token_matches(token, expected):
         return token
     auth = websocket.headers.get("authorization", "")
-    if auth.startswith("Bearer ") and auth.removeprefix("Bearer ") == expected:
+    if auth.startswith("Bearer ") and _token_matches(auth.removeprefix("Bearer "), expected):
         return expected
     await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
     raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
@@ -490,7 +516,7 @@ class SessionInfo(BaseModel):
     @classmethod
     def from_state(
         cls,
-        state: SessionState,
+        state: SessionState | SessionSummary,
         *,
         message_count: int = 0,
         sandbox: SessionSandboxSnapshot | None = None,
@@ -529,38 +555,34 @@ class SessionArchiveCommitResponse(BaseModel):
 
 
 def _session_message_count(session_id: str) -> int:
-    events = _engine.session_mgr.load_events(session_id)
-    if events:
-        return sum(1 for event in events if event.get("role") in {"user", "assistant"})
+    count = _engine.session_mgr.count_chat_messages(session_id)
+    if count is not None:
+        return count
 
     history = _history_from_messages(session_id)
     return sum(1 for message in history if message.role in {"user", "assistant"})
 
 
-def _compute_sorted_session_states(*, include_archived: bool) -> list[SessionState]:
-    states: list[SessionState] = []
-    for session_id in _engine.session_mgr.list_sessions():
-        state = _engine.session_mgr.load_state(session_id)
-        if state is None:
-            continue
-        if state.attributes.archived and not include_archived:
-            continue
-        states.append(state)
-
-    states.sort(
-        key=lambda state: (
-            not state.attributes.pinned,
-            -state.last_active.timestamp(),
-            state.session_id,
+def _compute_sorted_session_summaries(*, include_archived: bool) -> list[SessionSummary]:
+    summaries = [
+        summary
+        for summary in _engine.session_mgr.list_session_summaries()
+        if include_archived or not summary.attributes.archived
+    ]
+    summaries.sort(
+        key=lambda summary: (
+            not summary.attributes.pinned,
+            -summary.last_active.timestamp(),
+            summary.session_id,
         )
     )
-    return states
+    return summaries
 
 
 def _build_session_list_items(*, include_archived: bool, include_message_count: bool) -> list[dict[str, Any]]:
     items: list[dict[str, Any]] = []
-    for state in _compute_sorted_session_states(include_archived=include_archived):
-        session_info = _session_info_from_state(state, include_message_count=include_message_count)
+    for summary in _compute_sorted_session_summaries(include_archived=include_archived):
+        session_info = _session_info_from_state(summary, include_message_count=include_message_count)
         items.append(session_info.model_dump(mode="json"))
     return items
 
@@ -577,7 +599,7 @@ def _parse_session_cursor(cursor: str | None) -> int:
     return offset
 
 
-def _session_info_from_state(state: SessionState, *, include_message_count: bool) -> SessionInfo:
+def _session_info_from_state(state: SessionState | SessionSummary, *, include_message_count: bool) -> SessionInfo:
     message_count = _session_message_count(state.session_id) if include_message_count else 0
     sandbox = _engine.session_mgr.load_sandbox_snapshot(state.session_id)
     return SessionInfo.from_state(state, message_count=message_count, sandbox=sandbox)
@@ -615,7 +637,8 @@ async def create_session(
     _token: str = Depends(_verify_token),
 ) -> SessionInfo:
     body = body or SessionCreateRequest()
-    state = _engine.session_mgr.create_session(
+    state = await asyncio.to_thread(
+        _engine.session_mgr.create_session,
         body.channel_type,
         body.channel_ref,
         budget=_engine.config.agent.default_session_budget,
@@ -631,13 +654,14 @@ async def list_sessions(
     limit: int = Query(default=50, ge=1, le=200),
     cursor: str | None = None,
     _token: str = Depends(_verify_token),
-) -> SessionListPage:
-    return await _list_session_page(
+) -> Response:
+    page = await _list_session_page(
         include_message_count=include_message_count,
         include_archived=include_archived,
         limit=limit,
         cursor=cursor,
     )
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/sessions/{session_id}", response_model=SessionInfo)
@@ -672,7 +696,7 @@ async def update_session(
             raise HTTPException(status_code=409, detail="Cannot archive a session while an agent turn is running")
 
         state.attributes = next_attributes
-        _engine.session_mgr.save_state(state)
+        await asyncio.to_thread(_engine.session_mgr.save_state, state)
         _engine.update_active_state(session_id, attributes=next_attributes)
 
         try:
@@ -688,7 +712,7 @@ async def update_session(
                 state = refreshed
         except Exception:
             state.attributes = previous_attributes
-            _engine.session_mgr.save_state(state)
+            await asyncio.to_thread(_engine.session_mgr.save_state, state)
             _engine.update_active_state(session_id, attributes=previous_attributes)
             raise
 
@@ -822,7 +846,7 @@ async def delete_session(session_id: str, _token: str = Depends(_verify_token))
             await _session_archive.delete_session_archive(state)
         except Exception as exc:
             logger.warning(f"Session archive delete failed for {session_id}: {exc}")
-    if not _engine.session_mgr.delete_session(session_id):
+    if not await asyncio.to_thread(_engine.session_mgr.delete_session, session_id):
         raise HTTPException(status_code=404, detail="Session not found")
 
 
@@ -888,28 +912,37 @@ class HistoryMessage(BaseModel):
         return self
 
 
+# History responses can be large; dumping them straight to JSON bytes skips FastAPI's
+# response_model re-validation and jsonable_encoder pass.
+_HISTORY_ADAPTER: TypeAdapter[list[HistoryMessage]] = TypeAdapter(list[HistoryMessage])
+
+
 @router.get("/sessions/{session_id}/history", response_model=list[HistoryMessage])
 async def get_session_history(
     session_id: str,
     limit: Annotated[int, Query()] = -1,
     _token: str = Depends(_verify_token),
-) -> list[HistoryMessage]:
-    if _engine.session_mgr.load_state(session_id) is None:
+) -> Response:
+    result = await asyncio.to_thread(_load_history_messages, session_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    events = _engine.session_mgr.load_events(session_id)
-    result = (
-        [HistoryMessage.model_validate({**event, "event_index": index}) for index, event in enumerate(events)]
-        if events
-        else [
-            HistoryMessage.model_validate({**message.model_dump(mode="python"), "event_index": index})
-            for index, message in enumerate(_history_from_messages(session_id))
-        ]
-    )
-
     if limit > 0:
         result = result[-limit:]
-    return result
+    return Response(content=_HISTORY_ADAPTER.dump_json(result), media_type="application/json")
+
+
+def _load_history_messages(session_id: str) -> list[HistoryMessage] | None:
+    """Read and convert a session's history from disk; runs in a worker thread."""
+    if _engine.session_mgr.load_state(session_id) is None:
+        return None
+    events = _engine.session_mgr.load_events(session_id)
+    if events:
+        return [HistoryMessage.model_validate({**event, "event_index": index}) for index, event in enumerate(events)]
+    return [
+        HistoryMessage.model_validate({**message.model_dump(mode="python"), "event_index": index})
+        for index, message in enumerate(_history_from_messages(session_id))
+    ]
 
 
 def _history_from_messages(session_id: str) -> list[HistoryMessage]:
@@ -948,8 +981,32 @@ def _history_from_messages(session_id: str) -> list[HistoryMessage]:
 # --- WebSocket: Chat ---
 
 
+# /help never changes at runtime, so its frame is encoded once instead of per request.
+_HELP_RESULT = CommandResult(command="help", data={"commands": SLASH_COMMANDS})
+_HELP_FRAME = SERVER_ENVELOPE_ADAPTER.dump_json(_HELP_RESULT).decode()
+_QUIT_COMMANDS = frozenset({"/quit", "/exit"})
+
+_skills_command: tuple[list[dict[str, str]], CommandResult, str] | None = None
+
+
+def _static_command(command: str) -> tuple[CommandResult, str] | None:
+    """Return the result and pre-encoded frame for commands that need no session state."""
+    global _skills_command
+    if command == "/help":
+        return _HELP_RESULT, _HELP_FRAME
+    if command == "/skills":
+        # Re-encode only when /pull swaps in a new skill catalog.
+        listing = _engine.skill_listing
+        if _skills_command is None or _skills_command[0] is not listing:
+            result = CommandResult(command="skills", data=listing)
+            _skills_command = (listing, result, SERVER_ENVELOPE_ADAPTER.dump_json(result).decode())
+        return _skills_command[1], _skills_command[2]
+    return None
+
+
 async def _send(ws: WebSocket, msg: ServerEnvelope) -> None:
-    await ws.send_json(msg.model_dump(mode="json"))
+    # Clients parse frames with JSON.parse on text messages, so keep text frames.
+    await ws.send_text(SERVER_ENVELOPE_ADAPTER.dump_json(msg).decode())
 
 
 def _llm_activity_payload(activity: LlmRequestState | None) -> LlmActivity | None:
@@ -1047,6 +1104,9 @@ class WebSocketSubscriber:
     async def on_cancelled(self) -> None:
         await self._safe_send(Cancelled())
 
+    async def on_resync_required(self) -> None:
+        await self._safe_send(ResyncRequired())
+
     async def on_approval_request(self, req: ApprovalRequest) -> None:
         await self._safe_send(req)
 
@@ -1161,7 +1221,8 @@ async def chat_ws(
     session_id: str,
     _token: Annotated[str, Depends(_verify_ws_token)],
 ) -> None:
-    if _engine.session_mgr.load_state(session_id) is None:
+    # Existence only; the full state is loaded once when the session is activated below.
+    if _engine.session_mgr.load_summary(session_id) is None:
         logger.warning(f"WebSocket rejected — session {session_id} not found")
         await websocket.close(code=4004, reason="Session not found")
         return
@@ -1236,15 +1297,17 @@ async def chat_ws(
 
     try:
         while True:
-            raw = await websocket.receive_json()
+            raw = await websocket.receive_text()
             try:
-                client_msg = parse_client_message(raw)
-            except (ValueError, Exception) as exc:
+                client_msg = parse_client_frame(raw)
+            except ValueError as exc:  # pydantic.ValidationError, including malformed JSON
                 await _send(websocket, ErrorMessage(detail=str(exc)))
                 continue
 
-            current_state = _engine.session_mgr.load_state(session_id)
-            archived_session = current_state is not None and current_state.attributes.archived
+            # The archived flag is toggled via the REST API, so check the on-disk summary
+            # (cached per state-file version) rather than copying the whole state per frame.
+            summary = _engine.session_mgr.load_summary(session_id)
+            archived_session = summary is not None and summary.attributes.archived
 
             # --- Cancel in-flight agent turn ---
             if isinstance(client_msg, CancelRequest):
@@ -1286,11 +1349,12 @@ async def chat_ws(
 
             # --- Slash commands ---
             if user_input.startswith("/"):
-                if user_input.lower() in ("/quit", "/exit"):
+                command = user_input.lower()
+                if command in _QUIT_COMMANDS:
                     await websocket.close(code=1000)
                     break
 
-                if user_input.lower() == "/verbose":
+                if command == "/verbose":
                     active.verbose = not active.verbose
                     state_str = "on" if active.verbose else "off"
                     result = CommandResult(
@@ -1299,7 +1363,23 @@ async def chat_ws(
                     )
                     await _send(websocket, UserMessageNotification(content=user_input))
                     await _send(websocket, result)
-                    _engine.session_mgr.append_events(
+                    await asyncio.to_thread(
+                        _engine.session_mgr.append_events,
+                        session_id,
+                        [
+                            {"role": "user", "content": user_input},
+                            {"role": "command", "command": result.command, "data": result.data},
+                        ],
+                    )
+                    continue
+
+                static_command = _static_command(command)
+                if static_command is not None:
+                    result, frame = static_command
+                    await _send(websocket, UserMessageNotification(content=user_input))
+                    await websocket.send_text(frame)
+                    await asyncio.to_thread(
+                        _engine.session_mgr.append_events,
                         session_id,
                         [
                             {"role": "user", "content": user_input},
@@ -1316,7 +1396,8 @@ async def chat_ws(
                     )
                     await _send(websocket, UserMessageNotification(content=user_input))
                     await _send(websocket, result)
-                    _engine.session_mgr.append_events(
+                    await asyncio.to_thread(
+                        _engine.session_mgr.append_events,
                         session_id,
                         [
                             {"role": "user", "content": user_input},
@@ -1359,8 +1440,9 @@ class _InterceptHandler(logging.Handler):
             level = logger.level(record.levelname).name
         except ValueError:
             level = record.levelno
-        frame, depth = logging.currentframe(), 0
-        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+        # Start at our caller and skip the stdlib logging frames to find the original call site.
+        frame, depth = sys._getframe(1), 1
+        while frame is not None and frame.f_code.co_filename == _STDLIB_LOGGING_FILE:
             frame = frame.f_back
             depth += 1
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
@@ -1368,7 +1450,9 @@ class _InterceptHandler(logging.Handler):
 
 def _setup_logging(level: str = "INFO") -> None:
     logging.root.handlers = [_InterceptHandler()]
-    logging.root.setLevel(logging.DEBUG)
+    # Match the loguru sink level (loguru levels share stdlib numbering) so records the sink
+    # would drop are never created or routed through the intercept handler.
+    logging.root.setLevel(logger.level(level.upper()).no)
     for name in ("uvicorn", "uvicorn.error", "uvicorn.access", "fastapi"):
         log = logging.getLogger(name)
         log.handlers = [_InterceptHandler()]
@@ -1431,6 +1515,9 @@ def main() -> None:
         port=config.server.port,
         log_level=config.carapace.log_level,
         log_config=None,
+        loop=_UVICORN_LOOP,
+        http=_UVICORN_HTTP,
+        ws="websockets",
     )
 
 
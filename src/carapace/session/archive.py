@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
+from weakref import WeakValueDictionary
 
 from loguru import logger
 from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, ThinkingPart, ToolCallPart, UserPromptPart
@@ -44,8 +45,8 @@ class SessionArchiveService:
         self._git_store = git_store
         self._session_mgr = session_mgr
         self._config = config
-        self._session_locks: dict[str, asyncio.Lock] = {}
-        self._session_lock_refs: dict[str, int] = {}
+        # Weak values: a lock lives exactly as long as someone holds or waits on it.
+        self._session_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
 
     @property
     def enabled(self) -> bool:
@@ -68,19 +69,8 @@ class SessionArchiveService:
 
     @asynccontextmanager
     async def _locked_session(self, session_id: str):
-        lock = self._get_session_lock(session_id)
-        self._session_lock_refs[session_id] = self._session_lock_refs.get(session_id, 0) + 1
-        try:
-            async with lock:
-                yield
-        finally:
-            remaining_refs = self._session_lock_refs[session_id] - 1
-            if remaining_refs == 0:
-                self._session_lock_refs.pop(session_id, None)
-                if self._session_locks.get(session_id) is lock:
-                    self._session_locks.pop(session_id, None)
-            else:
-                self._session_lock_refs[session_id] = remaining_refs
+        async with self._get_session_lock(session_id):
+            yield
 
     async def commit_session(
         self,
@@ -14,7 +14,7 @@ import base64
 import contextlib
 import secrets
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal, InvalidOperation
@@ -93,6 +93,21 @@ from carapace.ws_models import (
 ModelType = Literal["agent", "sentinel", "title"]
 
 _DEFAULT_CONTEXT_CAP_TOKENS = 200_000
+_MAX_PENDING_SENDS = 128
+
+_HELP_RESULT: dict[str, Any] = {"command": "help", "data": {"commands": SLASH_COMMANDS}}
+_BUDGET_METRIC_ALIASES: dict[str, Literal["input", "output", "cost", "tool_calls"]] = {
+    "input": "input",
+    "output": "output",
+    "cost": "cost",
+    "tools": "tool_calls",
+    "tool": "tool_calls",
+    "tool_calls": "tool_calls",
+    "tool-calls": "tool_calls",
+}
+
+# (active session, argument after the command, full stripped command line) -> command result
+_SlashHandler = Callable[[ActiveSession, str, str], Awaitable[dict[str, Any]]]
 
 
 # Compatibility shims for tests that patch helpers on carapace.session.engine.
@@ -108,6 +123,15 @@ def note_llm_request_thinking() -> LlmRequestState | None:
     return _note_llm_request_thinking()
 
 
+def _resolve_escalation(active: ActiveSession, request_id: str, response: EscalationResponse | None) -> bool:
+    """Hand *response* to the callback waiting on *request_id*; ``False`` if nobody is waiting."""
+    waiter = active.escalation_waiters.get(request_id)
+    if waiter is None or waiter.done():
+        return False
+    waiter.set_result(response)
+    return True
+
+
 # security_mod is still imported for evaluate_domain_with (used in domain approval callback)
 
 
@@ -141,7 +165,7 @@ class SessionEngine(SessionTurnMixin):
         knowledge_dir: Path,
         git_store: GitStore,
         session_mgr: SessionManager,
-        skill_catalog: list[SkillInfo],
+        skill_catalog: Sequence[SkillInfo],
         agent_model: Model | None,
         sandbox_mgr: SandboxManager,
         credential_registry: CredentialRegistryProtocol,
@@ -152,13 +176,32 @@ class SessionEngine(SessionTurnMixin):
         self._knowledge_dir = knowledge_dir
         self._git_store = git_store
         self._session_mgr = session_mgr
-        self._skill_catalog = skill_catalog
+        self._set_skill_catalog(skill_catalog)
         self._agent_model = agent_model
         self._sandbox_mgr = sandbox_mgr
         self._model_factory = model_factory
         self._credential_registry = credential_registry
         self._active: dict[str, ActiveSession] = {}
         self._llm_semaphore = asyncio.Semaphore(config.agent.max_parallel_llm)
+        self._slash_handlers: dict[str, _SlashHandler] = {
+            "/help": self._slash_help,
+            "/security": self._slash_security,
+            "/approve-context": self._slash_approve_context,
+            "/session": self._slash_session,
+            "/skills": self._slash_skills,
+            "/memory": self._slash_memory,
+            "/retitle": self._slash_retitle,
+            "/models": self._slash_models,
+            "/model": self._slash_model,
+            "/model-agent": self._slash_model_agent,
+            "/model-sentinel": self._slash_model_sentinel,
+            "/model-title": self._slash_model_title,
+            "/usage": self._slash_usage,
+            "/budget": self._slash_budget,
+            "/pull": self._slash_pull,
+            "/push": self._slash_push,
+            "/reload": self._slash_reload,
+        }
 
         # Let SandboxManager retrieve activated skills so automatic setup can rerun on recreation
         sandbox_mgr.set_activated_skills_callback(self._get_activated_skills)
@@ -180,9 +223,15 @@ class SessionEngine(SessionTurnMixin):
         return self._data_dir
 
     @property
-    def skill_catalog(self) -> list[SkillInfo]:
+    def skill_catalog(self) -> tuple[SkillInfo, ...]:
         return self._skill_catalog
 
+    def _set_skill_catalog(self, skill_catalog: Sequence[SkillInfo]) -> None:
+        # tuple() is a no-op for SkillRegistry.scan() snapshots, so Deps can share the catalog per turn.
+        self._skill_catalog = tuple(skill_catalog)
+        # The /skills payload only changes with the catalog, so build it here once.
+        self._skill_listing = [{"name": s.name, "description": s.description.strip()} for s in skill_catalog]
+
     @property
     def sandbox_mgr(self) -> SandboxManager:
         return self._sandbox_mgr
@@ -191,6 +240,11 @@ class SessionEngine(SessionTurnMixin):
     def agent_model(self) -> Model | None:
         return self._agent_model
 
+    @property
+    def skill_listing(self) -> list[dict[str, str]]:
+        """The ``/skills`` payload; replaced (never mutated) whenever the catalog changes."""
+        return self._skill_listing
+
     @property
     def available_models(self) -> list[str]:
         return [e.model_id for e in self.available_model_entries]
@@ -630,6 +684,8 @@ class SessionEngine(SessionTurnMixin):
         active = self._active.pop(session_id, None)
         if active and active.agent_task and not active.agent_task.done():
             active.agent_task.cancel()
+        if active and active._sender_task is not None:
+            active._sender_task.cancel()
         self._sandbox_mgr.set_domain_approval_callback(session_id, None)
         self._sandbox_mgr.set_domain_notify_callback(session_id, None)
 
@@ -703,6 +759,38 @@ class SessionEngine(SessionTurnMixin):
             except Exception as exc:
                 logger.warning(f"Subscriber broadcast {method} failed: {exc}")
 
+    def _broadcast_soon(self, active: ActiveSession, method: str, *args: Any) -> None:
+        """Queue a broadcast from a sync callback.
+
+        A single sender task per session drains the queue in order. Frames are dropped
+        once the queue is full, so a stalled client cannot pile up work for the rest of
+        a long turn. The session is marked instead, and subscribers are told to resync
+        from the persisted events once the backlog has drained.
+        """
+        if active._send_queue is None:
+            active._send_queue = asyncio.Queue(maxsize=_MAX_PENDING_SENDS)
+        if active._sender_task is None or active._sender_task.done():
+            active._sender_task = asyncio.create_task(
+                self._drain_send_queue(active, active._send_queue),
+                name=f"sender-{active.state.session_id}",
+            )
+        try:
+            active._send_queue.put_nowait((method, args))
+        except asyncio.QueueFull:
+            active._broadcasts_dropped = True
+            logger.warning(
+                f"Dropping {method} broadcast for session {active.state.session_id}: "
+                + f"{_MAX_PENDING_SENDS} sends still pending, subscribers will be asked to resync"
+            )
+
+    async def _drain_send_queue(self, active: ActiveSession, queue: asyncio.Queue[tuple[str, tuple[Any, ...]]]) -> None:
+        while True:
+            method, args = await queue.get()
+            await self._broadcast(active, method, *args)
+            if queue.empty() and active._broadcasts_dropped:
+                active._broadcasts_dropped = False
+                await self._broadcast(active, "on_resync_required")
+
     # -- agent execution --
 
     def _build_deps(
@@ -726,7 +814,8 @@ class SessionEngine(SessionTurnMixin):
         def _append_session_events(events: list[dict[str, Any]]) -> None:
             self._session_mgr.append_events(session_id, events)
 
-        return Deps(
+        # Every field is already a validated object owned by the engine; skip re-validation.
+        return Deps.model_construct(
             config=self._config,
             data_dir=self._data_dir,
             knowledge_dir=self._knowledge_dir,
@@ -766,8 +855,6 @@ class SessionEngine(SessionTurnMixin):
         # Drain leftover approval responses
         while not active.tool_approval_queue.empty():
             active.tool_approval_queue.get_nowait()
-        while not active.escalation_queue.empty():
-            active.escalation_queue.get_nowait()
 
         active.agent_task = asyncio.create_task(
             self._run_turn(active, content, origin=origin),
@@ -871,7 +958,8 @@ class SessionEngine(SessionTurnMixin):
         if active.agent_task and not active.agent_task.done():
             active.agent_task.cancel()
             active.tool_approval_queue.put_nowait(None)
-            active.escalation_queue.put_nowait(None)
+            for request_id in list(active.escalation_waiters):
+                _resolve_escalation(active, request_id, None)
             with contextlib.suppress(asyncio.CancelledError, Exception):
                 await active.agent_task
             active.agent_task = None
@@ -886,8 +974,8 @@ class SessionEngine(SessionTurnMixin):
         if active:
             if isinstance(response, ApprovalResponse):
                 active.tool_approval_queue.put_nowait(response)
-            else:
-                active.escalation_queue.put_nowait(response)
+            elif not _resolve_escalation(active, response.request_id, response):
+                logger.debug(f"Ignoring response for unknown escalation {response.request_id} in {session_id}")
 
     # -- slash commands --
 
@@ -897,169 +985,149 @@ class SessionEngine(SessionTurnMixin):
         if not active:
             return None
 
-        parts = command.strip().split(maxsplit=1)
-        cmd = parts[0].lower()
+        line = command.strip()
+        parts = line.split(maxsplit=1)
+        handler = self._slash_handlers.get(parts[0].lower())
+        if handler is None:
+            return None
+        return await handler(active, parts[1].strip() if len(parts) > 1 else "", line)
 
-        if cmd == "/help":
-            return {"command": "help", "data": {"commands": SLASH_COMMANDS}}
+    async def _slash_help(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return _HELP_RESULT
 
-        if cmd == "/security":
-            security_path = self._knowledge_dir / "SECURITY.md"
-            policy = security_path.read_text() if security_path.exists() else "(no SECURITY.md loaded)"
-            log_count = len(active.security.action_log) if active.security else 0
-            eval_count = active.security.sentinel_eval_count if active.security else 0
-            return {
-                "command": "security",
-                "data": {
-                    "policy_preview": policy[:500] + ("..." if len(policy) > 500 else ""),
-                    "action_log_entries": log_count,
-                    "sentinel_evaluations": eval_count,
-                },
-            }
+    async def _slash_security(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        security_path = self._knowledge_dir / "SECURITY.md"
+        policy = security_path.read_text() if security_path.exists() else "(no SECURITY.md loaded)"
+        log_count = len(active.security.action_log) if active.security else 0
+        eval_count = active.security.sentinel_eval_count if active.security else 0
+        return {
+            "command": "security",
+            "data": {
+                "policy_preview": policy[:500] + ("..." if len(policy) > 500 else ""),
+                "action_log_entries": log_count,
+                "sentinel_evaluations": eval_count,
+            },
+        }
 
-        if cmd == "/approve-context":
-            if active.security:
-                active.security.append(UserVouchedEntry())
-            return {
-                "command": "approve-context",
-                "data": {"message": "Recorded: you vouch for the current agent context as trustworthy."},
-            }
+    async def _slash_approve_context(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        if active.security:
+            active.security.append(UserVouchedEntry())
+        return {
+            "command": "approve-context",
+            "data": {"message": "Recorded: you vouch for the current agent context as trustworthy."},
+        }
 
-        if cmd == "/session":
-            grants_summary = context_grants_session_summary(
-                session_id,
-                active.state.context_grants,
-                self._sandbox_mgr.get_cached_credential,
-            )
+    async def _slash_session(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        session_id = active.state.session_id
+        grants_summary = context_grants_session_summary(
+            session_id,
+            active.state.context_grants,
+            self._sandbox_mgr.get_cached_credential,
+        )
+        return {
+            "command": "session",
+            "data": {
+                "session_id": session_id,
+                "channel_type": active.state.channel_type,
+                "context_grants": grants_summary,
+                "allowed_domains": self._sandbox_mgr.get_domain_info(session_id),
+            },
+        }
+
+    async def _slash_skills(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return {"command": "skills", "data": list(self._skill_listing)}
+
+    async def _slash_memory(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        store = MemoryStore(self._knowledge_dir)
+        files = store.list_files()
+        return {"command": "memory", "data": files}
+
+    async def _slash_retitle(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        if arg:
+            active.state.title = arg
+            self._session_mgr.save_state(active.state)
+            await self._broadcast(active, "on_title_update", arg)
+            return {"command": "retitle", "data": {"message": f"Title set to: {arg}"}}
+        events = list(self._session_mgr.load_events(active.state.session_id))
+        new_title = await self._generate_title(active, events)
+        if not new_title:
             return {
-                "command": "session",
-                "data": {
-                    "session_id": session_id,
-                    "channel_type": active.state.channel_type,
-                    "context_grants": grants_summary,
-                    "allowed_domains": self._sandbox_mgr.get_domain_info(session_id),
-                },
+                "command": "retitle",
+                "data": {"message": "Could not generate a title (no eligible messages yet, or generation failed)."},
             }
+        return {"command": "retitle", "data": {"message": f"Title: {new_title}"}}
 
-        if cmd == "/skills":
-            skills = [{"name": s.name, "description": s.description.strip()} for s in self._skill_catalog]
-            return {"command": "skills", "data": skills}
+    async def _slash_models(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return self._handle_models_command(active)
 
-        if cmd == "/memory":
-            store = MemoryStore(self._knowledge_dir)
-            files = store.list_files()
-            return {"command": "memory", "data": files}
+    async def _slash_model(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return self._handle_model_all_command(active, arg)
 
-        if cmd == "/retitle":
-            arg = parts[1].strip() if len(parts) > 1 else ""
-            if arg:
-                active.state.title = arg
-                self._session_mgr.save_state(active.state)
-                await self._broadcast(active, "on_title_update", arg)
-                return {"command": "retitle", "data": {"message": f"Title set to: {arg}"}}
-            events = list(self._session_mgr.load_events(session_id))
-            new_title = await self._generate_title(active, events)
-            if not new_title:
-                return {
-                    "command": "retitle",
-                    "data": {"message": "Could not generate a title (no eligible messages yet, or generation failed)."},
-                }
-            return {"command": "retitle", "data": {"message": f"Title: {new_title}"}}
+    async def _slash_model_agent(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return await self._handle_model_command(active, "agent", arg, slash_line=line)
 
-        if cmd == "/models":
-            return self._handle_models_command(active)
+    async def _slash_model_sentinel(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return await self._handle_model_command(active, "sentinel", arg, slash_line=line)
 
-        if cmd == "/model":
-            return self._handle_model_all_command(
-                active,
-                parts[1].strip() if len(parts) > 1 else "",
-            )
+    async def _slash_model_title(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return await self._handle_model_command(active, "title", arg, slash_line=line)
 
-        if cmd in ("/model-agent", "/model-sentinel", "/model-title"):
-            model_map: dict[str, ModelType] = {
-                "/model-agent": "agent",
-                "/model-sentinel": "sentinel",
-                "/model-title": "title",
-            }
-            model_type = model_map[cmd]
-            return await self._handle_model_command(
-                active,
-                model_type,
-                parts[1].strip() if len(parts) > 1 else "",
-                slash_line=command.strip(),
-            )
+    async def _slash_usage(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        tracker = active.usage_tracker
+        costs = tracker.estimated_cost()
+        cat_costs = tracker.estimated_category_cost()
+        return {
+            "command": "usage",
+            "data": {
+                "models": {k: v.model_dump() for k, v in tracker.models.items()},
+                "categories": {k: v.model_dump() for k, v in tracker.categories.items()},
+                "total_input": tracker.total_input,
+                "total_output": tracker.total_output,
+                "total_tool_calls": tracker.tool_calls,
+                "costs": {k: str(v) for k, v in costs.items()},
+                "category_costs": {k: str(v) for k, v in cat_costs.items()},
+                "budget_gauges": [g.model_dump(mode="json") for g in self._budget_gauges(active)],
+                "last_llm_agent": self._usage_last_llm_payload_row(active, "agent"),
+                "last_llm_sentinel": self._usage_last_llm_payload_row(active, "sentinel"),
+            },
+        }
+
+    async def _slash_budget(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        if not arg:
+            return {"command": "budget", "data": self._budget_command_payload(active)}
 
-        if cmd == "/usage":
-            tracker = active.usage_tracker
-            costs = tracker.estimated_cost()
-            cat_costs = tracker.estimated_category_cost()
+        args = arg.split(maxsplit=1)
+        metric = _BUDGET_METRIC_ALIASES.get(args[0].lower()) if len(args) == 2 else None
+        if len(args) != 2 or metric is None:
             return {
-                "command": "usage",
+                "command": "budget",
                 "data": {
-                    "models": {k: v.model_dump() for k, v in tracker.models.items()},
-                    "categories": {k: v.model_dump() for k, v in tracker.categories.items()},
-                    "total_input": tracker.total_input,
-                    "total_output": tracker.total_output,
-                    "total_tool_calls": tracker.tool_calls,
-                    "costs": {k: str(v) for k, v in costs.items()},
-                    "category_costs": {k: str(v) for k, v in cat_costs.items()},
-                    "budget_gauges": [g.model_dump(mode="json") for g in self._budget_gauges(active)],
-                    "last_llm_agent": self._usage_last_llm_payload_row(active, "agent"),
-                    "last_llm_sentinel": self._usage_last_llm_payload_row(active, "sentinel"),
+                    **self._budget_command_payload(active),
+                    "error": ("Usage: /budget, /budget input N, /budget output N, /budget cost N, or /budget tools N"),
                 },
             }
 
-        if cmd == "/budget":
-            if len(parts) == 1:
-                return {"command": "budget", "data": self._budget_command_payload(active)}
-
-            args = parts[1].strip().split(maxsplit=1)
-            metric_aliases = {
-                "input": "input",
-                "output": "output",
-                "cost": "cost",
-                "tools": "tool_calls",
-                "tool": "tool_calls",
-                "tool_calls": "tool_calls",
-                "tool-calls": "tool_calls",
-            }
-            metric = metric_aliases.get(args[0].lower()) if len(args) == 2 else None
-            if len(args) != 2 or metric is None:
-                return {
-                    "command": "budget",
-                    "data": {
-                        **self._budget_command_payload(active),
-                        "error": (
-                            "Usage: /budget, /budget input N, /budget output N, /budget cost N, or /budget tools N"
-                        ),
-                    },
-                }
-
-            assert metric in ("input", "output", "cost", "tool_calls")
-
-            try:
-                value = self._parse_budget_limit_value(metric, args[1].strip())
-            except ValueError as exc:
-                return {
-                    "command": "budget",
-                    "data": {**self._budget_command_payload(active), "error": str(exc)},
-                }
-            message = self._set_budget_metric(active, metric, value)
+        try:
+            value = self._parse_budget_limit_value(metric, args[1].strip())
+        except ValueError as exc:
             return {
                 "command": "budget",
-                "data": self._budget_command_payload(active, message=message),
+                "data": {**self._budget_command_payload(active), "error": str(exc)},
             }
+        message = self._set_budget_metric(active, metric, value)
+        return {
+            "command": "budget",
+            "data": self._budget_command_payload(active, message=message),
+        }
 
-        if cmd == "/pull":
-            return await self._handle_pull_command()
-
-        if cmd == "/push":
-            return await self._handle_push_command()
+    async def _slash_pull(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return await self._handle_pull_command()
 
-        if cmd == "/reload":
-            return await self._handle_reload_command(session_id)
+    async def _slash_push(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return await self._handle_push_command()
 
-        return None
+    async def _slash_reload(self, active: ActiveSession, arg: str, line: str) -> dict[str, Any]:
+        return await self._handle_reload_command(active.state.session_id)
 
     # -- pull / push from/to remote --
 
@@ -1081,7 +1149,7 @@ class SessionEngine(SessionTurnMixin):
             summary = await self._git_store.pull_from_remote()
             # Re-scan skills after pull
             registry = SkillRegistry(self._knowledge_dir / "skills")
-            self._skill_catalog = registry.scan()
+            self._set_skill_catalog(registry.scan())
             return {"command": "pull", "data": {"message": summary}}
         except RuntimeError as exc:
             return {"command": "pull", "data": {"message": f"Pull failed: {exc}"}}
@@ -1425,125 +1493,141 @@ class SessionEngine(SessionTurnMixin):
             for old in list(active.pending_escalations):
                 if old.get("kind") == kind and old.get(match_key) == match_val:
                     logger.info(f"Superseding stale {kind} escalation {old['request_id']} for {match_val}")
-                    active.escalation_queue.put_nowait(
-                        EscalationResponse(request_id=old["request_id"], decision="deny")
+                    _resolve_escalation(
+                        active, old["request_id"], EscalationResponse(request_id=old["request_id"], decision="deny")
                     )
 
-            if kind == "git_push":
-                ref = context.get("ref", subject)
-                explanation = context.get("explanation", "")
-                changed_files: list[str] = context.get("changed_files", [])
-                self._session_mgr.append_events(
-                    session_id,
-                    [
+            # Register before broadcasting so an immediate reply cannot race past us.
+            waiter: asyncio.Future[EscalationResponse | None] = asyncio.get_running_loop().create_future()
+            active.escalation_waiters[request_id] = waiter
+            try:
+                if kind == "git_push":
+                    ref = context.get("ref", subject)
+                    explanation = context.get("explanation", "")
+                    changed_files: list[str] = context.get("changed_files", [])
+                    await asyncio.to_thread(
+                        self._session_mgr.append_events,
+                        session_id,
+                        [
+                            {
+                                "role": "git_push_approval",
+                                "request_id": request_id,
+                                "ref": ref,
+                                "explanation": explanation,
+                                "changed_files": changed_files,
+                            }
+                        ],
+                    )
+                    active.pending_escalations.append(
                         {
-                            "role": "git_push_approval",
                             "request_id": request_id,
+                            "kind": "git_push",
                             "ref": ref,
                             "explanation": explanation,
                             "changed_files": changed_files,
                         }
-                    ],
-                )
-                active.pending_escalations.append(
-                    {
-                        "request_id": request_id,
-                        "kind": "git_push",
-                        "ref": ref,
-                        "explanation": explanation,
-                        "changed_files": changed_files,
-                    }
-                )
-                await self._broadcast(
-                    active, "on_git_push_approval_request", request_id, ref, explanation, changed_files
-                )
-            elif kind == "credential_access":
-                vault_path = context.get("vault_path", subject)
-                cred_name = context.get("name", vault_path)
-                cred_desc = context.get("description", "")
-                explanation = context.get("explanation", "")
-                self._session_mgr.append_events(
-                    session_id,
-                    [
+                    )
+                    await self._broadcast(
+                        active, "on_git_push_approval_request", request_id, ref, explanation, changed_files
+                    )
+                elif kind == "credential_access":
+                    vault_path = context.get("vault_path", subject)
+                    cred_name = context.get("name", vault_path)
+                    cred_desc = context.get("description", "")
+                    explanation = context.get("explanation", "")
+                    await asyncio.to_thread(
+                        self._session_mgr.append_events,
+                        session_id,
+                        [
+                            {
+                                "role": "credential_approval",
+                                "request_id": request_id,
+                                "vault_paths": [vault_path],
+                                "names": [cred_name],
+                                "descriptions": [cred_desc],
+                                "explanation": explanation,
+                            }
+                        ],
+                    )
+                    active.pending_escalations.append(
                         {
-                            "role": "credential_approval",
                             "request_id": request_id,
+                            "kind": "credential_access",
+                            "vault_path": vault_path,
                             "vault_paths": [vault_path],
                             "names": [cred_name],
                             "descriptions": [cred_desc],
                             "explanation": explanation,
                         }
-                    ],
-                )
-                active.pending_escalations.append(
-                    {
-                        "request_id": request_id,
-                        "kind": "credential_access",
-                        "vault_path": vault_path,
-                        "vault_paths": [vault_path],
-                        "names": [cred_name],
-                        "descriptions": [cred_desc],
-                        "explanation": explanation,
-                    }
-                )
-                await self._broadcast(
-                    active,
-                    "on_credential_approval_request",
-                    request_id,
-                    [vault_path],
-                    [cred_name],
-                    [cred_desc],
-                    None,
-                    explanation,
-                )
+                    )
+                    await self._broadcast(
+                        active,
+                        "on_credential_approval_request",
+                        request_id,
+                        [vault_path],
+                        [cred_name],
+                        [cred_desc],
+                        None,
+                        explanation,
+                    )
+                else:
+                    await asyncio.to_thread(
+                        self._session_mgr.append_events,
+                        session_id,
+                        [
+                            {
+                                "role": "domain_access_approval",
+                                "request_id": request_id,
+                                "domain": subject,
+                                "command": cmd,
+                            }
+                        ],
+                    )
+                    active.pending_escalations.append(
+                        {"request_id": request_id, "kind": "domain_access", "domain": subject, "command": cmd}
+                    )
+                    await self._broadcast(active, "on_domain_access_approval_request", request_id, subject, cmd)
+                # Block until a subscriber responds to this request (or the turn is cancelled)
+                msg = await waiter
+            except BaseException:
+                active.pending_escalations = [p for p in active.pending_escalations if p["request_id"] != request_id]
+                raise
+            finally:
+                # Also reached when persisting or broadcasting the request fails, so no waiter leaks.
+                active.escalation_waiters.pop(request_id, None)
+            if msg is None:
+                active.pending_escalations.clear()
+                return UserEscalationDecision(allowed=False)
+            decision = msg.decision
+            message = normalize_optional_message(msg.message)
+            event_roles = {
+                "git_push": "git_push_approval",
+                "credential_access": "credential_approval",
+            }
+            event_role = event_roles.get(kind, "domain_access_approval")
+            if kind == "credential_access":
+                vp = context.get("vault_path", subject)
+                response_event: dict[str, Any] = {
+                    "role": event_role,
+                    "request_id": request_id,
+                    "vault_paths": [vp],
+                    "decision": decision,
+                    "decision_source": "user",
+                    "message": message,
+                }
             else:
-                self._session_mgr.append_events(
-                    session_id,
-                    [{"role": "domain_access_approval", "request_id": request_id, "domain": subject, "command": cmd}],
-                )
-                active.pending_escalations.append(
-                    {"request_id": request_id, "kind": "domain_access", "domain": subject, "command": cmd}
-                )
-                await self._broadcast(active, "on_domain_access_approval_request", request_id, subject, cmd)
-            # Block until a subscriber responds
-            while True:
-                msg = await active.escalation_queue.get()
-                if msg is None:
-                    active.pending_escalations.clear()
-                    return UserEscalationDecision(allowed=False)
-                if msg.request_id == request_id:
-                    decision = msg.decision
-                    message = normalize_optional_message(msg.message)
-                    event_roles = {
-                        "git_push": "git_push_approval",
-                        "credential_access": "credential_approval",
-                    }
-                    event_role = event_roles.get(kind, "domain_access_approval")
-                    if kind == "credential_access":
-                        vp = context.get("vault_path", subject)
-                        response_event: dict[str, Any] = {
-                            "role": event_role,
-                            "request_id": request_id,
-                            "vault_paths": [vp],
-                            "decision": decision,
-                            "decision_source": "user",
-                            "message": message,
-                        }
-                    else:
-                        response_event = {
-                            "role": event_role,
-                            "request_id": request_id,
-                            "domain": subject,
-                            "command": cmd,
-                            "decision": decision,
-                            "decision_source": "user",
-                            "message": message,
-                        }
-                    self._session_mgr.append_events(session_id, [response_event])
-                    active.pending_escalations = [
-                        p for p in active.pending_escalations if p["request_id"] != request_id
-                    ]
-                    return UserEscalationDecision(allowed=decision != "deny", message=message)
+                response_event = {
+                    "role": event_role,
+                    "request_id": request_id,
+                    "domain": subject,
+                    "command": cmd,
+                    "decision": decision,
+                    "decision_source": "user",
+                    "message": message,
+                }
+            await asyncio.to_thread(self._session_mgr.append_events, session_id, [response_event])
+            active.pending_escalations = [p for p in active.pending_escalations if p["request_id"] != request_id]
+            return UserEscalationDecision(allowed=decision != "deny", message=message)
 
         return _escalate
 
@@ -1581,21 +1665,17 @@ class SessionEngine(SessionTurnMixin):
                 approval_explanation=approval_explanation,
                 parent_tool_id=parent_id,
             )
-            task = asyncio.ensure_future(
-                self._broadcast(
-                    active,
-                    "on_domain_info",
-                    domain,
-                    detail,
-                    approval_source,
-                    approval_verdict,
-                    approval_explanation,
-                    tool_id,
-                    parent_id,
-                )
+            self._broadcast_soon(
+                active,
+                "on_domain_info",
+                domain,
+                detail,
+                approval_source,
+                approval_verdict,
+                approval_explanation,
+                tool_id,
+                parent_id,
             )
-            active._pending_sends.add(task)
-            task.add_done_callback(active._pending_sends.discard)
 
         return _notify
 
@@ -1688,22 +1768,18 @@ class SessionEngine(SessionTurnMixin):
                 parent_tool_id=parent_id,
                 match_args={"vault_path": vault_path},
             )
-            task = asyncio.ensure_future(
-                self._broadcast(
-                    active,
-                    "on_credential_info",
-                    vault_path,
-                    name,
-                    detail,
-                    approval_source,
-                    approval_verdict,
-                    approval_explanation,
-                    tool_id,
-                    parent_id,
-                )
+            self._broadcast_soon(
+                active,
+                "on_credential_info",
+                vault_path,
+                name,
+                detail,
+                approval_source,
+                approval_verdict,
+                approval_explanation,
+                tool_id,
+                parent_id,
             )
-            active._pending_sends.add(task)
-            task.add_done_callback(active._pending_sends.discard)
 
         return _notify
 
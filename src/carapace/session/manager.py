@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import io
 import json
+import os
 import secrets
 import shutil
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
@@ -14,7 +17,8 @@ from loguru import logger
 from pydantic import BaseModel
 from pydantic_ai import ModelMessage, ModelMessagesTypeAdapter
 
-from carapace.models import SessionAttributes, SessionBudget, SessionState
+from carapace import yaml_io
+from carapace.models import SessionAttributes, SessionBudget, SessionState, SessionSummary
 from carapace.sandbox.state import (
     SessionSandboxSnapshot,
     clear_sandbox_snapshot,
@@ -55,12 +59,131 @@ def _timestamped_event(event: dict[str, Any], *, now: datetime | None = None) ->
     return stamped
 
 
+def _chat_message_count(events: list[dict[str, Any]]) -> int:
+    return sum(1 for event in events if event.get("role") in ("user", "assistant"))
+
+
+def _state_stat(session_dir: str) -> os.stat_result | None:
+    try:
+        return os.stat(os.path.join(session_dir, "state.yaml"))
+    except FileNotFoundError:
+        return None
+
+
+def _stat_version(stat: os.stat_result | None) -> tuple[int, int] | None:
+    return (stat.st_mtime_ns, stat.st_size) if stat is not None else None
+
+
+# Each event is its own YAML document, so its role is the only "role:" key at column 0;
+# message bodies (block or multi-line scalars) are always indented below their key.
+_CHAT_ROLE_LINES = (b"\nrole: user\n", b"\nrole: assistant\n")
+# Leads every events.yaml this manager starts. Only files carrying it are known to follow the
+# layout above; legacy or hand-written logs are counted with a real parse instead.
+_EVENTS_HEADER = "# carapace events\n"
+
+
+def _scan_chat_message_count(data: bytes) -> int:
+    """Count user/assistant events in raw events.yaml bytes written by this manager, without parsing YAML."""
+    data = b"\n" + data
+    return sum(data.count(line) for line in _CHAT_ROLE_LINES)
+
+
+# Every write to history.yaml ends with this column-0 comment. Items are "- " entries at column 0
+# with their contents indented below, so the line cannot occur inside a message, and a file that
+# does not end with it was cut off mid-append.
+_HISTORY_BATCH_END = "# end of batch\n"
+_HISTORY_DUMP_KWARGS: dict[str, Any] = {"default_flow_style": False, "allow_unicode": True, "sort_keys": False}
+
+
+def _rewrite_history(history_path: Path, data: list[Any]) -> None:
+    yaml_io.dump_file(data, history_path, footer=_HISTORY_BATCH_END, **_HISTORY_DUMP_KWARGS)
+
+
+def _append_history(history_path: Path, items: list[Any]) -> None:
+    buf = io.StringIO()
+    yaml_io.dump(items, buf, **_HISTORY_DUMP_KWARGS)
+    buf.write(_HISTORY_BATCH_END)
+    with open(history_path, "a") as f:
+        f.write(buf.getvalue())
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _parse_history(data: bytes) -> tuple[list[Any], bool]:
+    """Parse history.yaml bytes, dropping a torn trailing append; returns ``(items, recovered)``."""
+    recovered = False
+    batch_end = _HISTORY_BATCH_END.encode()
+    if not data.endswith(batch_end):
+        last_end = data.rfind(b"\n" + batch_end)
+        if last_end >= 0:
+            data = data[: last_end + 1 + len(batch_end)]
+            recovered = True
+    try:
+        return yaml_io.safe_load(data) or [], recovered
+    except yaml.YAMLError:
+        # Files written before batches were marked: drop trailing items until the rest parses.
+        end = len(data)
+        while (end := data.rfind(b"\n- ", 0, end)) >= 0:
+            try:
+                items = yaml_io.safe_load(data[: end + 1])
+            except yaml.YAMLError:
+                continue
+            return items or [], True
+        raise
+
+
+def _file_version(path: Path) -> tuple[int, int] | None:
+    """Return ``(st_mtime_ns, st_size)`` for *path*, or None if it does not exist."""
+    try:
+        return _stat_version(path.stat())
+    except FileNotFoundError:
+        return None
+
+
+# Sessions whose parsed state.yaml / history.yaml stay in memory; older ones are re-read on demand.
+_PARSED_CACHE_SIZE = 32
+
+
+class _LruCache[V](OrderedDict[str, V]):
+    """Dict that keeps only the *maxsize* most recently stored or looked-up entries."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: str, value: V) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            self.move_to_end(key)
+        return super().get(key, default)
+
+
 class SessionManager:
     def __init__(self, data_dir: Path, on_change: Callable[[], None] | None = None):
         self.sessions_dir = data_dir / "sessions"
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
-        self._events_lock = RLock()
+        # Guards events.yaml and every cache below. Reads may run in worker threads (asyncio.to_thread)
+        # while writes happen on the event loop, so each version/data pair is checked and stored under it.
+        self._lock = RLock()
         self._on_change = on_change
+        # session_id -> ((st_mtime_ns, st_size) of state.yaml, parsed data / summary matching it).
+        # Parsed data is only kept for recently used sessions; summaries are small and cover the listing.
+        self._states: _LruCache[tuple[tuple[int, int], dict[str, Any]]] = _LruCache(_PARSED_CACHE_SIZE)
+        self._summaries: dict[str, tuple[tuple[int, int], SessionSummary]] = {}
+        # session_id -> ((st_mtime_ns, st_size) of events.yaml, user/assistant event count)
+        self._message_counts: dict[str, tuple[tuple[int, int], int]] = {}
+        # session_id -> ((st_mtime_ns, st_size) of history.yaml (or legacy history.json), its parsed JSON-mode data)
+        self._histories: _LruCache[tuple[tuple[int, int], list[Any]]] = _LruCache(_PARSED_CACHE_SIZE)
+        # Session directories this manager has created or written to; forgotten on delete.
+        self._known_dirs: set[Path] = set()
+        # (st_mtime_ns of sessions_dir, session IDs in it); dropped on our own create/delete since
+        # coarse directory timestamps could miss a change made within the same tick.
+        self._session_ids: tuple[int, list[str]] | None = None
 
     def _log_disk_read(self, kind: str, path: Path, *, session_id: str | None = None) -> None:
         if session_id is None:
@@ -68,6 +191,26 @@ class SessionManager:
             return
         logger.debug(f"Reading {kind} from disk for session {session_id}: {path}")
 
+    def _ensure_dir(self, session_dir: Path) -> None:
+        with self._lock:
+            if session_dir not in self._known_dirs:
+                session_dir.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(session_dir)
+                self._session_ids = None
+
+    def _store_if_current[T](
+        self,
+        cache: dict[str, tuple[tuple[int, int], T]],
+        session_id: str,
+        path: Path,
+        version: tuple[int, int],
+        value: T,
+    ) -> None:
+        """Cache *value* parsed outside the lock, unless *path* was rewritten in the meantime."""
+        with self._lock:
+            if _file_version(path) == version:
+                cache[session_id] = (version, value)
+
     def create_session(
         self,
         channel_type: str = "cli",
@@ -90,20 +233,32 @@ class SessionManager:
             created_at=now,
             last_active=now,
         )
-        session_dir = self.sessions_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.sessions_dir / session_id)
         self._save_state(state)
         return state
 
     def load_state(self, session_id: str) -> SessionState | None:
-        """Load session state without mutating last_active."""
+        """Load session state without mutating last_active.
+
+        The parsed YAML data is kept until state.yaml changes on disk, so repeated loads of an
+        unchanged session skip YAML parsing. Each caller gets a freshly validated state, which
+        pydantic-core builds faster than a deep copy of a cached model.
+        """
         state_path = self.sessions_dir / session_id / "state.yaml"
-        if not state_path.exists():
-            return None
-        self._log_disk_read("session state", state_path, session_id=session_id)
-        with open(state_path) as f:
-            raw = yaml.safe_load(f)
-        return SessionState.model_validate(raw)
+        with self._lock:
+            version = _file_version(state_path)
+            if version is None:
+                self._states.pop(session_id, None)
+                return None
+            cached = self._states.get(session_id)
+            if cached is not None and cached[0] == version:
+                return SessionState.model_validate(cached[1])
+            self._log_disk_read("session state", state_path, session_id=session_id)
+            data = state_path.read_bytes()
+        raw = yaml_io.safe_load(data)
+        state = SessionState.model_validate(raw)
+        self._store_if_current(self._states, session_id, state_path, version, raw)
+        return state
 
     def resume_session(self, session_id: str) -> SessionState | None:
         state = self.load_state(session_id)
@@ -112,34 +267,90 @@ class SessionManager:
         return state
 
     def list_sessions(self) -> list[str]:
-        if not self.sessions_dir.exists():
-            return []
+        """All session IDs, sorted by session ID, without touching the per-session files.
+
+        Adding or removing a session directory bumps the sessions dir mtime, so the listing is
+        only rescanned when that changes.
+        """
+        # Held across the (names-only) scan so a concurrent mkdir cannot be missed by a stale index.
+        with self._lock:
+            try:
+                dir_mtime = self.sessions_dir.stat().st_mtime_ns
+            except FileNotFoundError:
+                return []
+            if self._session_ids is not None and self._session_ids[0] == dir_mtime:
+                return list(self._session_ids[1])
+            self._log_disk_read("session directory listing", self.sessions_dir)
+            with os.scandir(self.sessions_dir) as it:
+                session_ids = sorted(entry.name for entry in it if entry.is_dir())
+            self._session_ids = (dir_mtime, session_ids)
+            return list(session_ids)
+
+    def _scan_session_states(self) -> list[tuple[str, os.stat_result | None]]:
+        """Session directories with their state.yaml stat (None if missing), newest first.
+
+        scandir answers is_dir() from d_type, so this costs one stat per session; callers
+        reuse that stat as the cache version instead of statting state.yaml again.
+        """
         self._log_disk_read("session directory listing", self.sessions_dir)
-        return sorted(
-            [d.name for d in self.sessions_dir.iterdir() if d.is_dir()],
-            key=lambda s: self._get_mtime(s),
-            reverse=True,
-        )
+        try:
+            with os.scandir(self.sessions_dir) as it:
+                entries = [(entry.name, _state_stat(entry.path)) for entry in it if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+        entries.sort(key=lambda entry: entry[1].st_mtime if entry[1] is not None else 0.0, reverse=True)
+        return entries
+
+    def list_session_summaries(self) -> list[SessionSummary]:
+        """Return listing metadata for all sessions, ordered like ``list_sessions``.
+
+        Summaries are cached per session and only rebuilt when state.yaml changed on disk,
+        so repeated listings do not re-parse every session's state.
+        """
+        summaries: list[SessionSummary] = []
+        for session_id, stat in self._scan_session_states():
+            summary = self._load_summary(session_id, _stat_version(stat))
+            if summary is not None:
+                summaries.append(summary)
+        return summaries
+
+    def load_summary(self, session_id: str) -> SessionSummary | None:
+        return self._load_summary(session_id, _file_version(self.sessions_dir / session_id / "state.yaml"))
+
+    def _load_summary(self, session_id: str, version: tuple[int, int] | None) -> SessionSummary | None:
+        with self._lock:
+            if version is None:
+                self._summaries.pop(session_id, None)
+                return None
+            cached = self._summaries.get(session_id)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        state = self.load_state(session_id)
+        if state is None:
+            return None
+        summary = SessionSummary.from_state(state)
+        state_path = self.sessions_dir / session_id / "state.yaml"
+        self._store_if_current(self._summaries, session_id, state_path, version, summary)
+        return summary
 
     def find_session(self, channel_type: str, channel_ref: str) -> str | None:
         """Return the most recently active session ID for the given channel, or None."""
-        candidates: list[tuple[float, str]] = []
-        for session_id in self.list_sessions():
-            state = self.load_state(session_id)
-            if state and state.channel_type == channel_type and state.channel_ref == channel_ref:
-                candidates.append((self._get_mtime(session_id), session_id))
-        if not candidates:
-            return None
-        return max(candidates, key=lambda t: t[0])[1]
-
-    def _get_mtime(self, session_id: str) -> float:
-        state_path = self.sessions_dir / session_id / "state.yaml"
-        if state_path.exists():
-            return state_path.stat().st_mtime
-        return 0.0
+        # Newest first, so the first match is the most recently active one.
+        for session_id, stat in self._scan_session_states():
+            summary = self._load_summary(session_id, _stat_version(stat))
+            if summary and summary.channel_type == channel_type and summary.channel_ref == channel_ref:
+                return session_id
+        return None
 
     def delete_session(self, session_id: str) -> bool:
         session_dir = self.sessions_dir / session_id
+        with self._lock:
+            self._states.pop(session_id, None)
+            self._summaries.pop(session_id, None)
+            self._message_counts.pop(session_id, None)
+            self._histories.pop(session_id, None)
+            self._known_dirs.discard(session_dir)
+            self._session_ids = None
         if session_dir.exists():
             shutil.rmtree(session_dir)
             self._notify_change()
@@ -150,38 +361,109 @@ class SessionManager:
         self._save_state(state)
 
     def _save_state(self, state: SessionState) -> None:
+        self._write_state(state)
+        self._notify_change()
+
+    def _write_state(self, state: SessionState) -> None:
         session_dir = self.sessions_dir / state.session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(session_dir)
         state_path = session_dir / "state.yaml"
-        with open(state_path, "w") as f:
-            yaml.dump(state.model_dump(mode="json"), f, default_flow_style=False)
-        self._notify_change()
+        data = state.model_dump(mode="json")
+        with self._lock:
+            yaml_io.dump_file(data, state_path, default_flow_style=False)
+            version = _file_version(state_path)
+            if version is not None:
+                # Cache the dumped data, not the live object, so loads match a fresh read.
+                self._states[state.session_id] = (version, data)
+            self._summaries.pop(state.session_id, None)
 
     def _notify_change(self) -> None:
         if self._on_change is not None:
             self._on_change()
 
     def load_history(self, session_id: str) -> list[ModelMessage]:
-        history_path = self.sessions_dir / session_id / "history.yaml"
-        if not history_path.exists():
-            # fallback to legacy JSON
-            json_path = history_path.with_suffix(".json")
-            if json_path.exists():
-                self._log_disk_read("session history (legacy json)", json_path, session_id=session_id)
-                return ModelMessagesTypeAdapter.validate_json(json_path.read_bytes())
-            return []
-        self._log_disk_read("session history", history_path, session_id=session_id)
-        with open(history_path) as f:
-            raw = yaml.safe_load(f)
-        return ModelMessagesTypeAdapter.validate_python(raw or [])
+        session_dir = self.sessions_dir / session_id
+        # The file is read under the lock so it cannot be caught mid-write; parsing happens outside it.
+        with self._lock:
+            history_path = session_dir / "history.yaml"
+            version = _file_version(history_path)
+            if version is None:
+                # fallback to legacy JSON
+                history_path = session_dir / "history.json"
+                version = _file_version(history_path)
+                if version is None:
+                    return []
+            # Parsing dominates for long sessions, so keep the parsed data for the file version
+            # and only re-validate it; each caller still gets fresh message objects.
+            cached = self._histories.get(session_id)
+            if cached is not None and cached[0] == version:
+                return ModelMessagesTypeAdapter.validate_python(cached[1])
+            legacy = history_path.suffix == ".json"
+            kind = "session history (legacy json)" if legacy else "session history"
+            self._log_disk_read(kind, history_path, session_id=session_id)
+            data = history_path.read_bytes()
+        raw, recovered = (json.loads(data), False) if legacy else _parse_history(data)
+        if recovered:
+            # Not cached, so the next save rewrites the file instead of appending after the torn tail.
+            logger.warning(f"Dropped an incomplete trailing write from {history_path}")
+        else:
+            self._store_if_current(self._histories, session_id, history_path, version, raw)
+        return ModelMessagesTypeAdapter.validate_python(raw)
 
     def save_history(self, session_id: str, messages: list[ModelMessage]) -> None:
+        self._write_history(session_id, messages)
+        self._notify_change()
+
+    def _write_history(self, session_id: str, messages: list[ModelMessage]) -> None:
         session_dir = self.sessions_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(session_dir)
         history_path = session_dir / "history.yaml"
         data = ModelMessagesTypeAdapter.dump_python(messages, mode="json")
-        with open(history_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        with self._lock:
+            # history.yaml is one top-level block sequence, so when the file still holds exactly the
+            # cached messages and the new history only extends them, appending the new items keeps it
+            # valid. Rewinds (retry / reset to turn) and unknown on-disk state fall back to a rewrite.
+            cached = self._histories.get(session_id)
+            persisted = cached[1] if cached is not None and cached[0] == _file_version(history_path) else None
+            if persisted and len(data) >= len(persisted) and data[: len(persisted)] == persisted:
+                new_items = data[len(persisted) :]
+                if not new_items:
+                    return
+                try:
+                    _append_history(history_path, new_items)
+                except OSError as exc:
+                    # The append may have left a partial batch behind; replace the file as a whole.
+                    logger.warning(f"Appending to {history_path} failed, rewriting it: {exc}")
+                    self._histories.pop(session_id, None)
+                    _rewrite_history(history_path, data)
+            else:
+                _rewrite_history(history_path, data)
+            version = _file_version(history_path)
+            if version is not None:
+                self._histories[session_id] = (version, data)
+
+    def commit_turn(
+        self,
+        state: SessionState,
+        *,
+        history: list[ModelMessage],
+        usage: UsageTracker,
+        llm_request_log: LlmRequestLog,
+        events: list[dict[str, Any]],
+    ) -> None:
+        """Persist everything a completed turn produced, with a single change notification.
+
+        Saving the pieces one by one would notify (and invalidate the session list cache)
+        once per file.
+        """
+        session_id = state.session_id
+        self._write_history(session_id, history)
+        self._write_state(state)
+        self.save_usage(session_id, usage)
+        self.save_llm_request_log(session_id, llm_request_log)
+        if events:
+            with self._lock:
+                self._append_events_unlocked(session_id, events)
         self._notify_change()
 
     # --- Usage tracking persistence ---
@@ -197,15 +479,16 @@ class SessionManager:
             return UsageTracker()
         self._log_disk_read("session usage", usage_path, session_id=session_id)
         with open(usage_path) as f:
-            raw = yaml.safe_load(f)
+            raw = yaml_io.safe_load(f)
         return UsageTracker.model_validate(raw or {})
 
     def save_usage(self, session_id: str, tracker: UsageTracker) -> None:
         session_dir = self.sessions_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(session_dir)
         usage_path = session_dir / "usage.yaml"
-        with open(usage_path, "w") as f:
-            yaml.dump(tracker.model_dump(mode="json"), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml_io.dump_file(
+            tracker.model_dump(mode="json"), usage_path, default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
 
     # --- Per-LLM-request log (API tokens + input-shape ratios) ---
 
@@ -215,15 +498,16 @@ class SessionManager:
             return LlmRequestLog()
         self._log_disk_read("llm request log", path, session_id=session_id)
         with open(path) as f:
-            raw = yaml.safe_load(f)
+            raw = yaml_io.safe_load(f)
         return LlmRequestLog.model_validate(raw or {})
 
     def save_llm_request_log(self, session_id: str, log: LlmRequestLog) -> None:
         session_dir = self.sessions_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(session_dir)
         path = session_dir / "llm_requests.yaml"
-        with open(path, "w") as f:
-            yaml.dump(log.model_dump(mode="json"), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml_io.dump_file(
+            log.model_dump(mode="json"), path, default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
 
     # --- In-flight LLM request activity ---
 
@@ -233,17 +517,18 @@ class SessionManager:
             return None
         self._log_disk_read("llm activity", path, session_id=session_id)
         with open(path) as f:
-            raw = yaml.safe_load(f)
+            raw = yaml_io.safe_load(f)
         if not raw:
             return None
         return LlmRequestState.model_validate(raw)
 
     def save_llm_request_state(self, session_id: str, state: LlmRequestState) -> None:
         session_dir = self.sessions_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(session_dir)
         path = session_dir / "llm_activity.yaml"
-        with open(path, "w") as f:
-            yaml.dump(state.model_dump(mode="json"), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml_io.dump_file(
+            state.model_dump(mode="json"), path, default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
 
     def clear_llm_request_state(self, session_id: str) -> None:
         path = self.sessions_dir / session_id / "llm_activity.yaml"
@@ -283,7 +568,7 @@ class SessionManager:
         self._log_disk_read("session events", events_path, session_id=session_id)
         with open(events_path) as f:
             try:
-                for doc in yaml.safe_load_all(f):
+                for doc in yaml_io.safe_load_all(f):
                     _append_loaded_event(doc, result)
             except yaml.YAMLError as exc:
                 logger.warning(f"Failed to parse events.yaml safely for session {session_id}: {exc}")
@@ -294,7 +579,7 @@ class SessionManager:
                     if not raw_doc.strip():
                         continue
                     try:
-                        doc = yaml.safe_load(raw_doc)
+                        doc = yaml_io.safe_load(raw_doc)
                     except yaml.YAMLError:
                         skipped_docs += 1
                         continue
@@ -304,41 +589,80 @@ class SessionManager:
         return result
 
     def load_events(self, session_id: str) -> list[dict[str, Any]]:
-        with self._events_lock:
+        with self._lock:
             return self._load_events_unlocked(session_id)
 
+    def count_chat_messages(self, session_id: str) -> int | None:
+        """Return the number of user/assistant events, or None if the session has no events.
+
+        The count is cached against the events.yaml version and advanced by ``append_events``,
+        so session listings do not re-parse every event log.
+        """
+        events_path = self.sessions_dir / session_id / "events.yaml"
+        with self._lock:
+            version = _file_version(events_path)
+            cached = self._message_counts.get(session_id)
+            if version is not None and cached is not None and cached[0] == version:
+                return cached[1]
+            if version is None:
+                # Legacy events.json sessions are rare; parse them the slow way.
+                events = self._load_events_unlocked(session_id)
+                return _chat_message_count(events) if events else None
+            data = events_path.read_bytes()
+            if data.startswith(_EVENTS_HEADER.encode()):
+                if not data[len(_EVENTS_HEADER) :].strip():
+                    return None
+                count = _scan_chat_message_count(data)
+            else:
+                if not data.strip():
+                    return None
+                count = _chat_message_count(self._load_events_unlocked(session_id))
+            self._message_counts[session_id] = (version, count)
+            return count
+
     def _append_events_unlocked(self, session_id: str, events: list[dict[str, Any]]) -> None:
         session_dir = self.sessions_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(session_dir)
         events_path = session_dir / "events.yaml"
+        previous_version = _file_version(events_path)
         ts = datetime.now(tz=UTC)
         with open(events_path, "a") as f:
+            if previous_version is None or previous_version[1] == 0:
+                f.write(_EVENTS_HEADER)
             for event in events:
                 f.write("---\n")
-                yaml.dump(
+                yaml_io.dump(
                     _to_yaml_safe(_timestamped_event(event, now=ts)),
                     f,
                     default_flow_style=False,
                     allow_unicode=True,
                     sort_keys=False,
                 )
+        cached = self._message_counts.pop(session_id, None)
+        version = _file_version(events_path)
+        if cached is not None and cached[0] == previous_version and version is not None:
+            self._message_counts[session_id] = (version, cached[1] + _chat_message_count(events))
 
     def append_events(self, session_id: str, events: list[dict[str, Any]]) -> None:
-        with self._events_lock:
+        with self._lock:
             self._append_events_unlocked(session_id, events)
         self._notify_change()
 
     def _save_events_unlocked(self, session_id: str, events: list[dict[str, Any]]) -> None:
         session_dir = self.sessions_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(session_dir)
         events_path = session_dir / "events.yaml"
         with open(events_path, "w") as f:
+            f.write(_EVENTS_HEADER)
             for event in events:
                 f.write("---\n")
-                yaml.dump(_to_yaml_safe(event), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                yaml_io.dump(_to_yaml_safe(event), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        version = _file_version(events_path)
+        if version is not None:
+            self._message_counts[session_id] = (version, _chat_message_count(events))
 
     def save_events(self, session_id: str, events: list[dict[str, Any]]) -> None:
-        with self._events_lock:
+        with self._lock:
             self._save_events_unlocked(session_id, events)
         self._notify_change()
 
@@ -347,7 +671,7 @@ class SessionManager:
         session_id: str,
         updater: Callable[[list[dict[str, Any]]], Any],
     ) -> Any:
-        with self._events_lock:
+        with self._lock:
             events = self._load_events_unlocked(session_id)
             original_ids = {id(event) for event in events}
             result = updater(events)
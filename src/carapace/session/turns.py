@@ -111,6 +111,8 @@ class SessionTurnHost(Protocol):
         **kwargs: Any,
     ) -> None: ...
 
+    def _broadcast_soon(self, active: ActiveSession, method: str, *args: Any) -> None: ...
+
     def _build_deps(
         self,
         active: ActiveSession,
@@ -211,21 +213,17 @@ class SessionTurnMixin(SessionTurnHost):
                 + f"approval={approval_source or '-'}:{approval_verdict or '-'} "
                 + f"args={_summarize_tool_args_for_log(args)}"
             )
-            task = asyncio.ensure_future(
-                self._broadcast(
-                    active,
-                    "on_tool_call",
-                    tool,
-                    args,
-                    detail,
-                    approval_source,
-                    approval_verdict,
-                    approval_explanation,
-                    tool_id,
-                )
+            self._broadcast_soon(
+                active,
+                "on_tool_call",
+                tool,
+                args,
+                detail,
+                approval_source,
+                approval_verdict,
+                approval_explanation,
+                tool_id,
             )
-            active._pending_sends.add(task)
-            task.add_done_callback(active._pending_sends.discard)
 
         def _tool_result_cb(tr: ToolResult) -> None:
             self._session_mgr.append_events(
@@ -246,9 +244,7 @@ class SessionTurnMixin(SessionTurnHost):
                 f"Tool result session={session_id} tool={tr.tool} exit_code={tr.exit_code} "
                 + f"summary={_summarize_tool_result_for_log(tr)}"
             )
-            task = asyncio.ensure_future(self._broadcast(active, "on_tool_result", tr))
-            active._pending_sends.add(task)
-            task.add_done_callback(active._pending_sends.discard)
+            self._broadcast_soon(active, "on_tool_result", tr)
 
         try:
             async with active.lock:
@@ -406,21 +402,20 @@ class SessionTurnMixin(SessionTurnHost):
         results: dict[str, bool | ToolDenied],
         responses: dict[str, ApprovalResponse],
     ) -> None:
+        events: list[dict[str, Any]] = []
         for tool_call_id, decision in results.items():
             response = responses.get(tool_call_id)
-            user_decision = "approved" if decision is True else "denied"
-            self._session_mgr.append_events(
-                session_id,
-                [
-                    {
-                        "role": "approval_response",
-                        "tool_call_id": tool_call_id,
-                        "decision": user_decision,
-                        "decision_source": "user",
-                        "message": normalize_optional_message(response.message) if response is not None else None,
-                    }
-                ],
+            events.append(
+                {
+                    "role": "approval_response",
+                    "tool_call_id": tool_call_id,
+                    "decision": "approved" if decision is True else "denied",
+                    "decision_source": "user",
+                    "message": normalize_optional_message(response.message) if response is not None else None,
+                }
             )
+        if events:
+            self._session_mgr.append_events(session_id, events)
 
     async def _collect_approval_results(
         self,
@@ -431,18 +426,26 @@ class SessionTurnMixin(SessionTurnHost):
         results: dict[str, bool | ToolDenied] = {}
         responses: dict[str, ApprovalResponse] = {}
         remaining = set(pending)
-        while remaining:
-            msg = await active.tool_approval_queue.get()
-            if msg is None:
-                for tool_call_id in remaining:
-                    results[tool_call_id] = ToolDenied("Agent cancelled.")
-                break
-            if msg.tool_call_id in remaining:
-                responses[msg.tool_call_id] = msg
-                results[msg.tool_call_id] = (
-                    True if msg.approved else ToolDenied(format_denial_message("user", msg.message))
-                )
-                remaining.discard(msg.tool_call_id)
+        cancelled = False
+        while remaining and not cancelled:
+            # Block for the first response, then drain whatever else the client already
+            # sent so a burst of approvals is handled in one pass.
+            batch = [await active.tool_approval_queue.get()]
+            while remaining and not active.tool_approval_queue.empty():
+                batch.append(active.tool_approval_queue.get_nowait())
+            for msg in batch:
+                if msg is None:
+                    cancelled = True
+                    break
+                if msg.tool_call_id in remaining:
+                    responses[msg.tool_call_id] = msg
+                    results[msg.tool_call_id] = (
+                        True if msg.approved else ToolDenied(format_denial_message("user", msg.message))
+                    )
+                    remaining.discard(msg.tool_call_id)
+        if cancelled:
+            for tool_call_id in remaining:
+                results[tool_call_id] = ToolDenied("Agent cancelled.")
         self._append_approval_response_events(session_id, results, responses)
         active.pending_approval_requests.clear()
         return results
@@ -506,8 +509,8 @@ class SessionTurnMixin(SessionTurnHost):
             self._generate_title(active, events),
             name=f"title-{session_id}",
         )
-        active._pending_sends.add(task)
-        task.add_done_callback(active._pending_sends.discard)
+        active._background_tasks.add(task)
+        task.add_done_callback(active._background_tasks.discard)
 
     async def _finalize_successful_turn(
         self,
@@ -517,11 +520,17 @@ class SessionTurnMixin(SessionTurnHost):
         output: str,
         thinking: str,
     ) -> None:
-        self._session_mgr.save_history(session_id, messages)
-        self._session_mgr.save_state(active.state)
-        self._save_turn_progress(session_id, active)
+        # The write (history fsync or rewrite, state, usage, LLM log, events) runs in a worker thread.
+        # Snapshot the live models first: other coroutines may keep recording usage while it runs.
+        await asyncio.to_thread(
+            self._session_mgr.commit_turn,
+            active.state.model_copy(deep=True),
+            history=list(messages),
+            usage=active.usage_tracker.model_copy(deep=True),
+            llm_request_log=active.llm_request_log.model_copy(deep=True),
+            events=[{"role": "assistant", "content": output}],
+        )
         await self._refresh_sandbox_snapshot_after_turn(session_id)
-        self._session_mgr.append_events(session_id, [{"role": "assistant", "content": output}])
 
         if output.startswith("Unexpected agent output type:"):
             await self._broadcast(active, "on_error", output, turn_terminal=True)
@@ -541,7 +550,8 @@ class SessionTurnMixin(SessionTurnHost):
                 thinking=thinking or None,
             )
 
-        self._schedule_title_generation_if_needed(active, session_id, self._session_mgr.load_events(session_id))
+        events = await asyncio.to_thread(self._session_mgr.load_events, session_id)
+        self._schedule_title_generation_if_needed(active, session_id, events)
 
     async def _finalize_failed_turn(
         self,
@@ -45,6 +45,7 @@ class SessionSubscriber(Protocol):
     async def on_done(self, content: str, usage: TurnUsage, *, thinking: str | None = None) -> None: ...
     async def on_error(self, detail: str, *, turn_terminal: bool = False) -> None: ...
     async def on_cancelled(self) -> None: ...
+    async def on_resync_required(self) -> None: ...
     async def on_approval_request(self, req: ApprovalRequest) -> None: ...
     async def on_domain_access_approval_request(self, request_id: str, domain: str, command: str) -> None: ...
     async def on_git_push_approval_request(
@@ -105,7 +106,7 @@ class ActiveSession:
     agent_task: asyncio.Task[None] | None = None
     subscribers: list[SessionSubscriber] = field(default_factory=list)
     tool_approval_queue: asyncio.Queue[ApprovalResponse | None] = field(default_factory=asyncio.Queue)
-    escalation_queue: asyncio.Queue[EscalationResponse | None] = field(default_factory=asyncio.Queue)
+    escalation_waiters: dict[str, asyncio.Future[EscalationResponse | None]] = field(default_factory=dict)
     usage_tracker: UsageTracker = field(default_factory=UsageTracker)
     llm_request_log: LlmRequestLog = field(default_factory=LlmRequestLog)
     llm_request_state: LlmRequestState | None = None
@@ -117,7 +118,10 @@ class ActiveSession:
     title_model_name: str | None = None
     pending_approval_requests: list[dict[str, Any]] = field(default_factory=list)
     pending_escalations: list[dict[str, Any]] = field(default_factory=list)
-    _pending_sends: set[asyncio.Task[Any]] = field(default_factory=set)
+    _background_tasks: set[asyncio.Task[Any]] = field(default_factory=set)
+    _send_queue: asyncio.Queue[tuple[str, tuple[Any, ...]]] | None = None
+    _sender_task: asyncio.Task[None] | None = None
+    _broadcasts_dropped: bool = False
 
 
 @dataclass
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -7,6 +9,7 @@ from typing import Any
 import yaml
 from loguru import logger
 
+from carapace import yaml_io
 from carapace.models import SkillCarapaceConfig, SkillInfo
 
 
@@ -17,48 +20,139 @@ class _SkillFrontmatter:
     metadata: dict[str, Any]
 
 
+_FRONTMATTER_DELIMITER = b"---"
+_FRONTMATTER_READ_CHUNK = 4096
+
+
+def _read_frontmatter_block(skill_md: Path) -> str | None:
+    """Return the text between the leading ``---`` and the next one, reading only as far as needed.
+
+    The SKILL.md body can be long and is only needed on activation, so it is never read here.
+    """
+    with skill_md.open("rb") as f:
+        buf = f.read(_FRONTMATTER_READ_CHUNK)
+        if not buf.startswith(_FRONTMATTER_DELIMITER):
+            return None
+        start = len(_FRONTMATTER_DELIMITER)
+        search_from = start
+        while (end := buf.find(_FRONTMATTER_DELIMITER, search_from)) < 0:
+            chunk = f.read(_FRONTMATTER_READ_CHUNK)
+            if not chunk:
+                return None
+            # A delimiter may straddle the chunk boundary.
+            search_from = max(start, len(buf) - len(_FRONTMATTER_DELIMITER) + 1)
+            buf += chunk
+    return buf[start:end].decode("utf-8", errors="replace")
+
+
+# "key: value" where the value is a plain YAML scalar that can only load as that exact string:
+# starts with a letter, no ":" or "#" (mapping / comment), no trailing continuation.
+_SIMPLE_FRONTMATTER_LINE_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*): +([A-Za-z][^:#\t\r\n]*?) *")
+# Plain scalars YAML 1.1 resolves to booleans or null rather than strings.
+_YAML_NON_STRING_WORDS = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+
+
+def _parse_simple_frontmatter(block: str) -> dict[str, str] | None:
+    """Parse flat ``key: value`` frontmatter without YAML, or return None if it needs the real parser."""
+    result: dict[str, str] = {}
+    for line in block.splitlines():
+        if not line.strip(" ") or line.startswith("#"):
+            continue
+        match = _SIMPLE_FRONTMATTER_LINE_RE.fullmatch(line)
+        if match is None or match.group(2).lower() in _YAML_NON_STRING_WORDS:
+            return None
+        result[match.group(1)] = match.group(2)
+    return result
+
+
+# SKILL.md path -> ((st_mtime_ns, st_size), parsed frontmatter). Shared by all registries, so
+# rescans (a fresh registry after /pull, per-call registries in tools) only re-parse skills
+# whose SKILL.md actually changed.
+_frontmatter_cache: dict[Path, tuple[tuple[int, int], _SkillFrontmatter]] = {}
+# SKILL.md path -> ((st_mtime_ns, st_size), full text), for repeated skill activations.
+_instructions_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+# skill dir -> ((SKILL.md version, carapace.yaml version), validated config). Either file
+# changing (or appearing / disappearing) re-reads the config; callers only read the result.
+_carapace_config_cache: dict[
+    Path, tuple[tuple[tuple[int, int] | None, tuple[int, int] | None], SkillCarapaceConfig | None]
+] = {}
+
+
+def _file_version(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 class SkillRegistry:
     def __init__(self, skills_dir: Path):
         self.skills_dir = skills_dir
-        self._catalog: list[SkillInfo] | None = None
+        self._catalog: tuple[SkillInfo, ...] | None = None
+
+    def scan(self) -> tuple[SkillInfo, ...]:
+        """Scan skills/ directory and load frontmatter only (progressive disclosure).
 
-    def scan(self) -> list[SkillInfo]:
-        """Scan skills/ directory and load frontmatter only (progressive disclosure)."""
+        The returned tuple is an immutable snapshot, so repeated calls can safely hand out the same object.
+        """
         if self._catalog is not None:
             return self._catalog
 
         catalog: list[SkillInfo] = []
-        if not self.skills_dir.exists():
-            self._catalog = catalog
-            return catalog
+        try:
+            with os.scandir(self.skills_dir) as it:
+                entries = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            self._catalog = ()
+            return self._catalog
 
-        for skill_dir in sorted(self.skills_dir.iterdir()):
-            if not skill_dir.is_dir():
+        for entry in entries:
+            skill_dir = Path(entry.path)
+            try:
+                info = self._parse_frontmatter(skill_dir / "SKILL.md", skill_dir)
+            except FileNotFoundError:
                 continue
-            skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
-                continue
-            info = self._parse_frontmatter(skill_md, skill_dir)
             if info:
                 catalog.append(info)
 
-        self._catalog = catalog
-        return catalog
+        self._catalog = tuple(catalog)
+        return self._catalog
 
     def get_full_instructions(self, skill_name: str) -> str | None:
         """Load the full SKILL.md body for a skill (activation)."""
-        skill_dir = self.skills_dir / skill_name
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
+        skill_md = self.skills_dir / skill_name / "SKILL.md"
+        try:
+            stat = skill_md.stat()
+        except FileNotFoundError:
             return None
-        return skill_md.read_text()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _instructions_cache.get(skill_md)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        text = skill_md.read_text()
+        _instructions_cache[skill_md] = (version, text)
+        return text
 
     def get_carapace_config(self, skill_name: str) -> SkillCarapaceConfig | None:
         """Load carapace skill config from SKILL.md frontmatter or ``carapace.yaml``."""
         skill_dir = self.skills_dir / skill_name
-        skill_md = skill_dir / "SKILL.md"
-        if skill_md.exists():
-            frontmatter = self._load_frontmatter(skill_md, skill_dir)
+        version = (_file_version(skill_dir / "SKILL.md"), _file_version(skill_dir / "carapace.yaml"))
+        cached = _carapace_config_cache.get(skill_dir)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        config = self._read_carapace_config(skill_name, skill_dir)
+        _carapace_config_cache[skill_dir] = (version, config)
+        return config
+
+    def _read_carapace_config(self, skill_name: str, skill_dir: Path) -> SkillCarapaceConfig | None:
+        try:
+            frontmatter: _SkillFrontmatter | None = self._load_frontmatter(skill_dir / "SKILL.md", skill_dir)
+        except FileNotFoundError:
+            frontmatter = None
+        if frontmatter is not None:
             raw_metadata = frontmatter.metadata.get("carapace")
             if raw_metadata is not None:
                 try:
@@ -67,14 +161,13 @@ class SkillRegistry:
                     logger.warning(f"Failed to parse metadata.carapace in SKILL.md for skill '{skill_name}': {exc}")
                     return None
 
-        cfg_path = skill_dir / "carapace.yaml"
-        if not cfg_path.exists():
-            return None
         try:
-            raw = yaml.safe_load(cfg_path.read_text())
+            raw = yaml_io.safe_load((skill_dir / "carapace.yaml").read_text())
             if not isinstance(raw, dict):
                 return None
             return SkillCarapaceConfig.model_validate(raw)
+        except FileNotFoundError:
+            return None
         except Exception as exc:
             logger.warning(f"Failed to parse carapace.yaml for skill '{skill_name}': {exc}")
             return None
@@ -89,19 +182,27 @@ class SkillRegistry:
         )
 
     def _load_frontmatter(self, skill_md: Path, skill_dir: Path) -> _SkillFrontmatter:
-        text = skill_md.read_text()
+        stat = skill_md.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _frontmatter_cache.get(skill_md)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        frontmatter = self._read_frontmatter(skill_md, skill_dir)
+        _frontmatter_cache[skill_md] = (version, frontmatter)
+        return frontmatter
+
+    def _read_frontmatter(self, skill_md: Path, skill_dir: Path) -> _SkillFrontmatter:
         fallback = _SkillFrontmatter(name=skill_dir.name, description="", metadata={})
-        if not text.startswith("---"):
+        block = _read_frontmatter_block(skill_md)
+        if block is None:
             return fallback
 
-        parts = text.split("---", 2)
-        if len(parts) < 3:
-            return fallback
-
-        try:
-            raw = yaml.safe_load(parts[1])
-        except yaml.YAMLError:
-            return fallback
+        raw: Any = _parse_simple_frontmatter(block)
+        if raw is None:
+            try:
+                raw = yaml_io.safe_load(block)
+            except yaml.YAMLError:
+                return fallback
 
         if not isinstance(raw, dict):
             return fallback
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 from carapace.security.context import ApprovalSource, ApprovalVerdict
 from carapace.usage import BudgetGauge, LlmRequestPhase, LlmSource
@@ -89,28 +89,22 @@ class ResetToTurnRequest(BaseModel):
     event_index: int
 
 
-ClientEnvelope = (
-    UserMessage | ApprovalResponse | EscalationResponse | CancelRequest | RetryLatestTurnRequest | ResetToTurnRequest
-)
+ClientEnvelope = Annotated[
+    UserMessage | ApprovalResponse | EscalationResponse | CancelRequest | RetryLatestTurnRequest | ResetToTurnRequest,
+    Field(discriminator="type"),
+]
+
+CLIENT_ENVELOPE_ADAPTER: TypeAdapter[ClientEnvelope] = TypeAdapter(ClientEnvelope)
 
 
 def parse_client_message(raw: dict[str, Any]) -> ClientEnvelope:
-    match raw.get("type"):
-        case "message":
-            return UserMessage.model_validate(raw)
-        case "approval_response":
-            return ApprovalResponse.model_validate(raw)
-        case "escalation_response":
-            return EscalationResponse.model_validate(raw)
-        case "cancel":
-            return CancelRequest.model_validate(raw)
-        case "retry_latest_turn":
-            return RetryLatestTurnRequest.model_validate(raw)
-        case "reset_to_turn":
-            return ResetToTurnRequest.model_validate(raw)
-        case other:
-            msg = f"Unknown client message type: {other}"
-            raise ValueError(msg)
+    """Validate an already-decoded client message; unknown types raise ``pydantic.ValidationError``."""
+    return CLIENT_ENVELOPE_ADAPTER.validate_python(raw)
+
+
+def parse_client_frame(data: str | bytes) -> ClientEnvelope:
+    """Decode and validate a raw WebSocket frame in one pass, without an intermediate dict."""
+    return CLIENT_ENVELOPE_ADAPTER.validate_json(data)
 
 
 # --- Server → Client ---
@@ -255,6 +249,12 @@ class Cancelled(BaseModel):
     detail: str = "Agent cancelled."
 
 
+class ResyncRequired(BaseModel):
+    """Server → Client: live updates were dropped; reload the session history."""
+
+    type: Literal["resync"] = "resync"
+
+
 class SessionTitleUpdate(BaseModel):
     """Server → Client: updated session title."""
 
@@ -286,7 +286,7 @@ class UserMessageNotification(BaseModel):
     content: str
 
 
-ServerEnvelope = (
+ServerEnvelope = Annotated[
     TokenChunk
     | ThinkingChunk
     | ToolCallInfo
@@ -299,8 +299,13 @@ ServerEnvelope = (
     | CommandResult
     | ErrorMessage
     | Cancelled
+    | ResyncRequired
     | SessionTitleUpdate
     | LlmActivityUpdate
     | StatusUpdate
-    | UserMessageNotification
-)
+    | UserMessageNotification,
+    Field(discriminator="type"),
+]
+
+# Built once so every outbound frame reuses the compiled tagged-union serializer.
+SERVER_ENVELOPE_ADAPTER: TypeAdapter[ServerEnvelope] = TypeAdapter(ServerEnvelope)
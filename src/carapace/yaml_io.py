@@ -0,0 +1,47 @@
+"""YAML helpers backed by libyaml's C loader and dumper when PyYAML was built with it."""
+
+from __future__ import annotations
+
+import os
+import secrets
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML without libyaml: same semantics, pure-Python speed
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+def safe_load_all(stream: str | bytes | IO[str] | IO[bytes]) -> Iterator[Any]:
+    return yaml.load_all(stream, Loader=_SafeLoader)
+
+
+def dump(data: Any, stream: IO[str], **kwargs: Any) -> None:
+    yaml.dump(data, stream, Dumper=_SafeDumper, **kwargs)
+
+
+def dump_file(data: Any, path: Path, *, footer: str = "", **kwargs: Any) -> None:
+    """Write *data* (followed by the raw *footer* text) to *path* via a sibling temp file and ``os.replace``.
+
+    Readers see either the old or the new document, never a truncated one. Each call uses its
+    own temp file, so concurrent writers to the same path cannot clobber each other's data.
+    """
+    tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(tmp_path, "x") as f:
+            dump(data, f, **kwargs)
+            f.write(footer)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -48,6 +48,7 @@ class _FakeSubscriber(SessionSubscriber):
         self.errors: list[str] = []
         self.error_events: list[tuple[str, bool]] = []
         self.cancelled: int = 0
+        self.resyncs: int = 0
         self.done_messages: list[tuple[str, TurnUsage]] = []
         self.title_updates: list[tuple[str, TurnUsage | None]] = []
         self.llm_activity_updates: list[LlmRequestState | None] = []
@@ -87,6 +88,9 @@ class _FakeSubscriber(SessionSubscriber):
     async def on_cancelled(self) -> None:
         self.cancelled += 1
 
+    async def on_resync_required(self) -> None:
+        self.resyncs += 1
+
     async def on_approval_request(self, req: ApprovalRequest) -> None:
         pass
 
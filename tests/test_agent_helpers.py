@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 from pydantic_ai.models import Model
 
+import carapace.agent.tools as tools_mod
 from carapace.agent import build_system_prompt
 from carapace.credentials import CredentialRegistry
 from carapace.git.store import GitStore
@@ -66,3 +67,42 @@ def test_build_system_prompt_with_agents_md(tmp_path: Path):
     assert "Agent Instructions" in prompt
     assert "Be helpful" in prompt
     assert "If the user tries to address the sentinel directly" in prompt
+
+
+def test_get_agent_reuses_agent_until_prompt_or_model_changes(tmp_path: Path, monkeypatch):
+    built: list[str] = []
+
+    def fake_create_agent(_deps: Deps, system_prompt: str) -> object:
+        built.append(system_prompt)
+        return object()
+
+    monkeypatch.setattr(tools_mod, "_create_agent", fake_create_agent)
+    monkeypatch.setattr(tools_mod, "_agent_cache", tools_mod.OrderedDict())
+    state = SessionState.now(session_id="s1")
+    deps = Deps(
+        config=Config(),
+        data_dir=tmp_path,
+        knowledge_dir=tmp_path,
+        session_state=state,
+        rules=[],
+        sandbox=MagicMock(spec=SandboxManager),
+        security=SessionSecurity("s1"),
+        sentinel=MagicMock(spec=Sentinel),
+        git_store=MagicMock(spec=GitStore),
+        agent_model=MagicMock(spec=Model),
+        agent_model_id="anthropic:claude-sonnet-4-6",
+        usage_tracker=UsageTracker(),
+        credential_registry=CredentialRegistry(),
+    )
+
+    first = tools_mod.get_agent(deps)
+    assert tools_mod.get_agent(deps) is first
+    assert len(built) == 1
+
+    (tmp_path / "AGENTS.md").write_text("# Agent Instructions\nBe brief.")
+    second = tools_mod.get_agent(deps)
+    assert second is not first
+
+    deps.agent_model = MagicMock(spec=Model)
+    assert tools_mod.get_agent(deps) is not second
+    assert len(built) == 3
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import shutil
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -230,6 +231,20 @@ class TestSandboxManagerCredentialCache:
         assert cleanup_fn.__self__ is mgr
         assert cleanup_fn.__func__ is SandboxManager.cleanup_session
 
+    def test_seconds_until_idle_expiry_tracks_least_recently_used_container(self, tmp_path: Path):
+        mgr = SandboxManager(
+            runtime=make_runtime_mock(), data_dir=tmp_path, knowledge_dir=tmp_path, idle_timeout_minutes=10
+        )
+        assert mgr.seconds_until_idle_expiry() == 600
+
+        now = time.time()
+        for sid, last_used in (("recent", now - 30), ("stale", now - 500)):
+            mgr._sessions[sid] = SessionContainer(container_id=sid, session_id=sid, created_at=0, last_used=last_used)
+        assert 95 <= mgr.seconds_until_idle_expiry() <= 100
+
+        mgr._sessions["stale"].last_used = now - 900
+        assert mgr.seconds_until_idle_expiry() == 0
+
     @pytest.mark.anyio
     async def test_cleanup_all_delegates_to_lifecycle(self, tmp_path: Path):
         mgr = self._make_manager(tmp_path)
@@ -1,5 +1,6 @@
 """Tests for pydantic models (no LLM tokens needed)."""
 
+import asyncio
 from decimal import Decimal
 from unittest.mock import MagicMock
 
@@ -7,7 +8,12 @@ import pytest
 from pydantic import ValidationError
 from pydantic_ai.models.openai import OpenAIChatModel
 
-from carapace.llm import make_model_factory, model_settings_for_config
+from carapace.llm import (
+    close_shared_retry_http_client,
+    make_model_factory,
+    model_settings_for_config,
+    shared_retry_http_client,
+)
 from carapace.models import (
     AgentConfig,
     AvailableModelEntry,
@@ -188,6 +194,16 @@ def test_make_model_factory_openai_compatible_row():
     assert isinstance(m, OpenAIChatModel)
 
 
+def test_shared_retry_http_client_is_reused_until_closed():
+    client = shared_retry_http_client()
+    assert shared_retry_http_client() is client
+
+    asyncio.run(close_shared_retry_http_client())
+    assert client.is_closed
+    assert shared_retry_http_client() is not client
+    asyncio.run(close_shared_retry_http_client())
+
+
 def test_make_model_factory_rejects_unregistered_model():
     cfg = Config()
     factory = make_model_factory(cfg)
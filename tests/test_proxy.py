@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 from pathlib import Path
 from typing import Any, cast
@@ -9,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+import carapace.skills as skills_mod
 from carapace.models import SkillCarapaceConfig
 from carapace.sandbox.exec_flow import SandboxExecCoordinator, SandboxExecState
 from carapace.sandbox.manager import _CONTEXT_TUNNEL_HELPER, SandboxManager
@@ -81,6 +83,12 @@ class TestProxyCheckDomain:
         proxy = self._make_proxy({"PyPI.org"})
         assert proxy._is_allowed("sess-1", "pypi.org")
 
+    def test_wildcard_matches_any_depth_but_not_apex(self):
+        proxy = self._make_proxy({"pypi.org", "*.Example.com"})
+        assert proxy._is_allowed("sess-1", "a.b.EXAMPLE.com")
+        assert not proxy._is_allowed("sess-1", "example.com")
+        assert not proxy._is_allowed("sess-1", "notexample.com")
+
 
 # ── ProxyServer URL parsing ─────────────────────────────────────────
 
@@ -203,10 +211,20 @@ async def test_handle_http_supports_absolute_https_urls(monkeypatch: pytest.Monk
 # ── SandboxManager allowlists ───────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def allowlist_runtime() -> MagicMock:
+    # These tests never touch the container runtime, so one spec'd mock is shared across them.
+    return make_runtime_mock()
+
+
 class TestSandboxManagerAllowlists:
+    @pytest.fixture(autouse=True)
+    def _runtime(self, allowlist_runtime: MagicMock) -> None:
+        allowlist_runtime.reset_mock()
+        self.runtime = allowlist_runtime
+
     def _make_manager(self, tmp_path: Path):
-        runtime = make_runtime_mock()
-        return SandboxManager(runtime=runtime, data_dir=tmp_path, knowledge_dir=tmp_path)
+        return SandboxManager(runtime=self.runtime, data_dir=tmp_path, knowledge_dir=tmp_path)
 
     def test_empty_by_default(self, tmp_path: Path):
         mgr = self._make_manager(tmp_path)
@@ -229,6 +247,17 @@ class TestSandboxManagerAllowlists:
         mgr._cleanup_tracking("sess-1")
         assert mgr.get_allowed_domains("sess-1") == set()
 
+    def test_effective_domains_union_permanent_and_exec_temp(self, tmp_path: Path):
+        mgr = self._make_manager(tmp_path)
+        assert mgr.get_effective_domains("sess-1") == frozenset()
+        mgr.allow_domains("sess-1", {"a.com"})
+        mgr._exec_temp_domains["sess-1"] = {"b.com"}
+        effective = mgr.get_effective_domains("sess-1")
+        assert effective == {"a.com", "b.com"}
+        assert isinstance(effective, frozenset)
+        mgr._proxy_bypass_sessions.add("sess-1")
+        assert mgr.get_effective_domains("sess-1") == {"*"}
+
     def test_proxy_env_includes_token(self, tmp_path: Path):
         mgr = self._make_manager(tmp_path)
         env = mgr._build_proxy_env("sess-1", "my-secret-token", "http://172.18.0.2:3128")
@@ -257,10 +286,11 @@ class TestSandboxManagerAllowlists:
 
     def test_token_lookup(self, tmp_path: Path):
         mgr = self._make_manager(tmp_path)
-        mgr._token_to_session["abc123"] = "sess-1"
+        mgr._session_tokens["sess-1"] = "abc123"
         assert mgr.verify_session_token("sess-1", "abc123") is True
         assert mgr.verify_session_token("sess-1", "wrong") is False
         assert mgr.verify_session_token("wrong-session", "abc123") is False
+        assert mgr.verify_session_token("sess-1", "äbc123") is False
 
     def test_token_lookup_restores_persisted_token(self, tmp_path: Path):
         mgr = self._make_manager(tmp_path)
@@ -270,11 +300,9 @@ class TestSandboxManagerAllowlists:
 
         assert mgr.verify_session_token("sess-1", "persisted-token") is True
         assert mgr._session_tokens["sess-1"] == "persisted-token"
-        assert mgr._token_to_session["persisted-token"] == "sess-1"
 
     def test_cleanup_clears_tokens(self, tmp_path: Path):
         mgr = self._make_manager(tmp_path)
-        mgr._token_to_session["tok"] = "sess-1"
         mgr._session_tokens["sess-1"] = "tok"
         mgr._cleanup_tracking("sess-1")
         assert mgr.verify_session_token("sess-1", "tok") is False
@@ -563,7 +591,7 @@ class TestcarapaceYamlParsing:
         registry = SkillRegistry(tmp_path)
         cfg = registry.get_carapace_config("inline")
         assert cfg is not None
-        assert cfg.network.domains == ["api.example.com"]
+        assert cfg.network.domains == ("api.example.com",)
         assert len(cfg.commands) == 1
         assert cfg.commands[0].name == "inline-search"
 
@@ -578,7 +606,7 @@ class TestcarapaceYamlParsing:
         registry = SkillRegistry(tmp_path)
         cfg = registry.get_carapace_config("web-search")
         assert cfg is not None
-        assert cfg.network.domains == ["api.example.com", "*.cdn.example.com"]
+        assert cfg.network.domains == ("api.example.com", "*.cdn.example.com")
 
     def test_parse_network_tunnels(self, tmp_path: Path):
         skill_dir = tmp_path / "zoho-mail"
@@ -613,7 +641,7 @@ class TestcarapaceYamlParsing:
         registry = SkillRegistry(tmp_path)
         cfg = registry.get_carapace_config("precedence")
         assert cfg is not None
-        assert cfg.network.domains == ["inline.example.com"]
+        assert cfg.network.domains == ("inline.example.com",)
 
     def test_no_carapace_yaml(self, tmp_path: Path):
         skill_dir = tmp_path / "plain"
@@ -632,6 +660,30 @@ class TestcarapaceYamlParsing:
         registry = SkillRegistry(tmp_path)
         assert registry.get_carapace_config("bad") is None
 
+    def test_carapace_config_reloaded_only_after_change(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        skill_dir = tmp_path / "cached"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("Body.\n")
+        cfg_path = skill_dir / "carapace.yaml"
+        cfg_path.write_text("network:\n  domains:\n    - a.example.com\n")
+        registry = SkillRegistry(tmp_path)
+        first = registry.get_carapace_config("cached")
+        assert first is not None
+
+        def fail_safe_load(_text: str) -> Any:
+            raise AssertionError("carapace.yaml should not be re-parsed")
+
+        monkeypatch.setattr(skills_mod.yaml_io, "safe_load", fail_safe_load)
+        cfg = SkillRegistry(tmp_path).get_carapace_config("cached")
+        assert cfg is first
+        assert cfg.network.domains == ("a.example.com",)
+
+        monkeypatch.undo()
+        cfg_path.write_text("network:\n  domains:\n    - b.example.com\n    - c.example.com\n")
+        cfg = registry.get_carapace_config("cached")
+        assert cfg is not None
+        assert cfg.network.domains == ("b.example.com", "c.example.com")
+
     def test_invalid_frontmatter_carapace_does_not_fallback_to_file(self, tmp_path: Path):
         skill_dir = tmp_path / "bad-inline"
         skill_dir.mkdir()
@@ -704,7 +756,8 @@ class TestcarapaceYamlParsing:
         registry = SkillRegistry(tmp_path)
         cfg = registry.get_carapace_config("minimal")
         assert cfg is not None
-        assert cfg.network.domains == []
+        assert cfg.network.domains == ()
+        assert cfg.hints == {"likely_classification": "read_external"}
 
     def test_model_validation(self):
         cfg = SkillCarapaceConfig.model_validate(
@@ -717,7 +770,7 @@ class TestcarapaceYamlParsing:
                 "commands": [{"name": "demo", "command": "uv run demo"}],
             }
         )
-        assert cfg.network.domains == ["a.com"]
+        assert cfg.network.domains == ("a.com",)
         assert cfg.network.tunnels[0].display == "imap.a.com:993 via :1993"
         assert len(cfg.credentials) == 1
         assert cfg.credentials[0].vault_path == "x/y"
@@ -726,6 +779,18 @@ class TestcarapaceYamlParsing:
         assert cfg.commands[0].name == "demo"
         assert cfg.commands[0].command == "uv run demo"
 
+    def test_model_is_frozen(self):
+        cfg = SkillCarapaceConfig.model_validate({"commands": [{"name": "demo", "command": "  uv run demo  "}]})
+        assert cfg.commands[0].command == "uv run demo"
+        with pytest.raises(ValueError, match="frozen"):
+            cfg.hints = {}
+        with pytest.raises(ValueError, match="frozen"):
+            cfg.commands[0].command = "rm -rf /"
+        assert isinstance(cfg.commands, tuple)
+        assert isinstance(cfg.network.domains, tuple)
+        with pytest.raises(TypeError):
+            cfg.hints["likely_classification"] = "write_external"  # type: ignore[index]
+
     def test_model_validation_rejects_multiline_command(self):
         with pytest.raises(ValueError, match="single line"):
             SkillCarapaceConfig.model_validate(
@@ -1059,6 +1124,11 @@ class TestProxyCredentialExtraction:
     def test_garbage(self):
         assert ProxyServer._extract_basic_credentials(b"garbage\r\n") is None
 
+    def test_invalid_base64_or_utf8(self):
+        assert ProxyServer._extract_basic_credentials(b"Proxy-Authorization: Basic abc\r\n") is None
+        encoded = base64.b64encode(b"sess-1:\xff").decode()
+        assert ProxyServer._extract_basic_credentials(f"Proxy-Authorization: basic {encoded}\r\n".encode()) is None
+
 
 # ── ProxyServer start/stop ──────────────────────────────────────────
 
@@ -1075,3 +1145,29 @@ async def test_proxy_start_stop():
     assert proxy._server is not None
     assert proxy._server.is_serving()
     await proxy.stop()
+
+
+@pytest.mark.anyio
+async def test_proxy_stop_aborts_idle_clients():
+    proxy = ProxyServer(
+        verify_session_token=lambda sid, tok: False,
+        get_allowed_domains=lambda sid: set(),
+        host="127.0.0.1",
+        port=0,
+    )
+    await proxy.start()
+    assert proxy._server is not None
+    port = proxy._server.sockets[0].getsockname()[1]
+    # The handler waits up to 30s for a request line from this client.
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        await asyncio.wait_for(proxy.stop(), timeout=5)
+        assert not proxy._server.is_serving()
+        # The lingering connection is cut rather than left to the handler's own timeout.
+        try:
+            leftover = await asyncio.wait_for(reader.read(), timeout=5)
+        except ConnectionResetError:
+            leftover = b""
+        assert leftover == b""
+    finally:
+        writer.close()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -97,17 +98,19 @@ def _setup_server(tmp_path, monkeypatch):
     )
 
 
-@pytest.fixture()
+# Stateless (no lifespan, no cookies), so one client serves the whole module; the mutable
+# server globals are re-initialised per test by _setup_server.
+@pytest.fixture(scope="module")
 def bearer() -> str:
     return _TEST_TOKEN
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def client() -> TestClient:
     return TestClient(app)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def auth_headers(bearer) -> dict[str, str]:
     return {"Authorization": f"Bearer {bearer}"}
 
@@ -156,6 +159,19 @@ def test_list_sessions(client, auth_headers):
     assert len(sessions) >= 2
 
 
+def test_large_json_responses_are_gzip_compressed(client, auth_headers):
+    for _ in range(12):
+        client.post("/api/sessions", headers=auth_headers)
+
+    resp = client.get("/api/sessions", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert len(resp.json()["items"]) >= 12
+
+    small = client.get("/api/sessions?limit=1", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
 def test_list_sessions_skips_message_count_by_default(client, auth_headers, monkeypatch):
     create_resp = client.post("/api/sessions", headers=auth_headers)
     sid = create_resp.json()["session_id"]
@@ -1020,49 +1036,27 @@ def _consume_status(ws):
     return msg
 
 
-def test_ws_help_command(client, auth_headers, bearer):
-    create_resp = client.post("/api/sessions", headers=auth_headers)
-    sid = create_resp.json()["session_id"]
-
-    with client.websocket_connect(f"/api/chat/{sid}?token={bearer}") as ws:
-        _consume_status(ws)
-        ws.send_json({"type": "message", "content": "/help"})
-        echo = ws.receive_json()
-        assert echo["type"] == "user_message"
-        assert echo["content"] == "/help"
-        msg = ws.receive_json()
-        assert msg["type"] == "command_result"
-        assert msg["command"] == "help"
-        assert "commands" in msg["data"]
-
-
-def test_ws_security_command(client, auth_headers, bearer):
+def test_ws_slash_commands(client, auth_headers, bearer):
+    """Read-only slash commands share one connection; each echoes, then returns its result."""
     create_resp = client.post("/api/sessions", headers=auth_headers)
     sid = create_resp.json()["session_id"]
 
     with client.websocket_connect(f"/api/chat/{sid}?token={bearer}") as ws:
         _consume_status(ws)
-        ws.send_json({"type": "message", "content": "/security"})
-        echo = ws.receive_json()
-        assert echo["type"] == "user_message"
-        msg = ws.receive_json()
-        assert msg["type"] == "command_result"
-        assert msg["command"] == "security"
-
-
-def test_ws_session_command(client, auth_headers, bearer):
-    create_resp = client.post("/api/sessions", headers=auth_headers)
-    sid = create_resp.json()["session_id"]
-
-    with client.websocket_connect(f"/api/chat/{sid}?token={bearer}") as ws:
-        _consume_status(ws)
-        ws.send_json({"type": "message", "content": "/session"})
-        echo = ws.receive_json()
-        assert echo["type"] == "user_message"
-        msg = ws.receive_json()
-        assert msg["type"] == "command_result"
-        assert msg["command"] == "session"
-        assert msg["data"]["session_id"] == sid
+        results: dict[str, Any] = {}
+        for command in ("help", "security", "session", "skills", "memory", "verbose"):
+            ws.send_json({"type": "message", "content": f"/{command}"})
+            echo = ws.receive_json()
+            assert echo["type"] == "user_message"
+            assert echo["content"] == f"/{command}"
+            msg = ws.receive_json()
+            assert msg["type"] == "command_result"
+            assert msg["command"] == command
+            results[command] = msg["data"]
+
+    assert "commands" in results["help"]
+    assert results["session"]["session_id"] == sid
+    assert results["verbose"]["verbose"] is False
 
 
 def test_ws_reset_to_turn_emits_ack(client, auth_headers, bearer):
@@ -1175,56 +1169,28 @@ def test_ws_budget_command_emits_status_refresh(client, auth_headers, bearer):
         assert status["usage"]["budget_gauges"][0]["key"] == "input"
 
 
-def test_ws_skills_command(client, auth_headers, bearer):
-    create_resp = client.post("/api/sessions", headers=auth_headers)
-    sid = create_resp.json()["session_id"]
-
-    with client.websocket_connect(f"/api/chat/{sid}?token={bearer}") as ws:
-        _consume_status(ws)
-        ws.send_json({"type": "message", "content": "/skills"})
-        echo = ws.receive_json()
-        assert echo["type"] == "user_message"
-        msg = ws.receive_json()
-        assert msg["type"] == "command_result"
-        assert msg["command"] == "skills"
-
-
-def test_ws_memory_command(client, auth_headers, bearer):
-    create_resp = client.post("/api/sessions", headers=auth_headers)
-    sid = create_resp.json()["session_id"]
-
-    with client.websocket_connect(f"/api/chat/{sid}?token={bearer}") as ws:
-        _consume_status(ws)
-        ws.send_json({"type": "message", "content": "/memory"})
-        echo = ws.receive_json()
-        assert echo["type"] == "user_message"
-        msg = ws.receive_json()
-        assert msg["type"] == "command_result"
-        assert msg["command"] == "memory"
-
-
-def test_ws_verbose_command(client, auth_headers, bearer):
+def test_ws_unknown_command(client, auth_headers, bearer):
     create_resp = client.post("/api/sessions", headers=auth_headers)
     sid = create_resp.json()["session_id"]
 
     with client.websocket_connect(f"/api/chat/{sid}?token={bearer}") as ws:
         _consume_status(ws)
-        ws.send_json({"type": "message", "content": "/verbose"})
-        echo = ws.receive_json()
-        assert echo["type"] == "user_message"
+        ws.send_json({"type": "message", "content": "/foobar"})
         msg = ws.receive_json()
-        assert msg["type"] == "command_result"
-        assert msg["command"] == "verbose"
-        assert msg["data"]["verbose"] is False
+        assert msg["type"] == "error"
+        assert "Unknown command" in msg["detail"]
 
 
-def test_ws_unknown_command(client, auth_headers, bearer):
+def test_ws_invalid_frames_report_errors_and_keep_connection(client, auth_headers, bearer):
     create_resp = client.post("/api/sessions", headers=auth_headers)
     sid = create_resp.json()["session_id"]
 
     with client.websocket_connect(f"/api/chat/{sid}?token={bearer}") as ws:
         _consume_status(ws)
-        ws.send_json({"type": "message", "content": "/foobar"})
-        msg = ws.receive_json()
-        assert msg["type"] == "error"
-        assert "Unknown command" in msg["detail"]
+        ws.send_text("not json")
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "bogus"})
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "message", "content": "/help"})
+        assert ws.receive_json()["type"] == "user_message"
+        assert ws.receive_json()["command"] == "help"
@@ -270,7 +270,6 @@ async def test_archive_service_cleans_up_lock_after_archive_delete(tmp_path) ->
     assert archived_state is not None
     assert await service.delete_session_archive(archived_state) is True
     assert service._session_locks == {}
-    assert service._session_lock_refs == {}
 
 
 @pytest.mark.asyncio
@@ -9,12 +9,15 @@ from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from pydantic_ai import ToolDenied
 from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
 
+import carapace.session.engine as engine_mod
 import carapace.usage as usage_mod
 from carapace.models import ContextGrant, CredentialRegistryProtocol, SkillCredentialDecl
 from carapace.sandbox.state import SessionSandboxSnapshot
 from carapace.usage import LlmRequestState, ModelUsage
+from carapace.ws_models import ApprovalResponse, EscalationResponse
 from tests.session_helpers import _FakeSubscriber, _make_engine, _patch_sentinel, _without_timestamps
 
 
@@ -333,6 +336,116 @@ def test_handle_thinking_token_chunk_updates_buffer_and_broadcasts(tmp_path: Pat
     asyncio.run(_run())
 
 
+def test_collect_approval_results_drains_queued_responses_into_one_append(tmp_path: Path) -> None:
+    async def _run() -> None:
+        with _patch_sentinel():
+            engine = _make_engine(tmp_path)
+
+        sid = engine.session_mgr.create_session().session_id
+        active = engine.get_or_activate(sid)
+        active.tool_approval_queue.put_nowait(ApprovalResponse(tool_call_id="call-1", approved=True))
+        active.tool_approval_queue.put_nowait(ApprovalResponse(tool_call_id="call-2", approved=False, message="no"))
+
+        with patch.object(engine.session_mgr, "append_events", wraps=engine.session_mgr.append_events) as append:
+            results = await engine._collect_approval_results(active, sid, {"call-1", "call-2"})
+
+        assert results["call-1"] is True
+        assert isinstance(results["call-2"], ToolDenied)
+        append.assert_called_once()
+        assert [event["decision"] for event in _without_timestamps(engine.session_mgr.load_events(sid))] == [
+            "approved",
+            "denied",
+        ]
+
+    asyncio.run(_run())
+
+
+def test_broadcast_soon_asks_for_resync_after_dropping_frames(tmp_path: Path) -> None:
+    async def _run() -> None:
+        with _patch_sentinel():
+            engine = _make_engine(tmp_path)
+
+        sid = engine.session_mgr.create_session().session_id
+        active = engine.get_or_activate(sid)
+        subscriber = _FakeSubscriber()
+        engine.subscribe(sid, subscriber)
+
+        # Nothing yields in between, so the sender task cannot drain while we fill the queue.
+        for index in range(engine_mod._MAX_PENDING_SENDS + 1):
+            engine._broadcast_soon(active, "on_token", str(index))
+        assert active._send_queue is not None
+        assert active._send_queue.full()
+
+        while not active._send_queue.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert subscriber.token_chunks == [str(index) for index in range(engine_mod._MAX_PENDING_SENDS)]
+        assert subscriber.resyncs == 1
+        assert not active._broadcasts_dropped
+
+        # Once caught up, ordinary frames do not trigger another resync.
+        engine._broadcast_soon(active, "on_token", "later")
+        await asyncio.sleep(0)
+        assert subscriber.token_chunks[-1] == "later"
+        assert subscriber.resyncs == 1
+
+        engine.deactivate(sid)
+        assert active._sender_task is not None
+        with pytest.raises(asyncio.CancelledError):
+            await active._sender_task
+
+    asyncio.run(_run())
+
+
+def test_concurrent_escalations_each_receive_their_own_response(tmp_path: Path) -> None:
+    async def _run() -> None:
+        with _patch_sentinel():
+            engine = _make_engine(tmp_path)
+
+        sid = engine.session_mgr.create_session().session_id
+        active = engine.get_or_activate(sid)
+        escalate = engine._make_escalation_cb(active)
+
+        first = asyncio.create_task(escalate(sid, "a.example.com", {"command": "curl a"}))
+        second = asyncio.create_task(escalate(sid, "b.example.com", {"command": "curl b"}))
+        # Escalation events are persisted off the loop, so wait until both requests are announced.
+        while len(active.pending_escalations) < 2:
+            await asyncio.sleep(0.01)
+        first_id, second_id = (p["request_id"] for p in active.pending_escalations)
+
+        # Answer out of order: a shared queue would hand the first reply to the wrong waiter.
+        await engine.submit_approval(sid, EscalationResponse(request_id=second_id, decision="deny"))
+        await engine.submit_approval(sid, EscalationResponse(request_id=first_id, decision="allow"))
+
+        assert (await first).allowed is True
+        assert (await second).allowed is False
+        assert active.escalation_waiters == {}
+        assert active.pending_escalations == []
+
+    asyncio.run(_run())
+
+
+def test_failed_escalation_broadcast_does_not_leak_waiter(tmp_path: Path) -> None:
+    async def _run() -> None:
+        with _patch_sentinel():
+            engine = _make_engine(tmp_path)
+
+        sid = engine.session_mgr.create_session().session_id
+        active = engine.get_or_activate(sid)
+        escalate = engine._make_escalation_cb(active)
+
+        async def failing_broadcast(*_args: Any, **_kwargs: Any) -> None:
+            raise RuntimeError("subscriber gone")
+
+        engine._broadcast = failing_broadcast  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError, match="subscriber gone"):
+            await escalate(sid, "a.example.com", {"command": "curl a"})
+        assert active.escalation_waiters == {}
+        assert active.pending_escalations == []
+
+    asyncio.run(_run())
+
+
 def test_truncate_incomplete_events_keeps_completed_user_approved_exec(tmp_path: Path) -> None:
     with _patch_sentinel():
         engine = _make_engine(tmp_path)
@@ -6,7 +6,14 @@ import asyncio
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
+from typing import Any
 
+import pytest
+from pydantic_ai import ModelMessagesTypeAdapter
+from pydantic_ai.messages import ModelRequest, UserPromptPart
+
+import carapace.session.manager as manager_mod
+from carapace import yaml_io
 from carapace.models import ContextGrant, SessionAttributes, SessionBudget, SkillCredentialDecl
 from carapace.sandbox.state import SessionSandboxSnapshot
 from carapace.security.context import (
@@ -16,7 +23,7 @@ from carapace.security.context import (
     normalize_optional_message,
 )
 from carapace.session import SessionManager
-from carapace.usage import LlmRequestState
+from carapace.usage import LlmRequestLog, LlmRequestState, UsageTracker
 
 
 def test_create_session(tmp_path: Path):
@@ -96,6 +103,288 @@ def test_list_sessions(tmp_path: Path):
     assert s2.session_id in sessions
 
 
+def test_list_sessions_rescans_only_when_sessions_dir_changes(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    s1 = mgr.create_session()
+    assert mgr.list_sessions() == [s1.session_id]
+
+    def fail_scandir(_path):
+        raise AssertionError("sessions dir should not be rescanned")
+
+    monkeypatch.setattr(manager_mod.os, "scandir", fail_scandir)
+    mgr.save_state(s1)
+    assert mgr.list_sessions() == [s1.session_id]
+
+    monkeypatch.undo()
+    s2 = mgr.create_session()
+    assert set(mgr.list_sessions()) == {s1.session_id, s2.session_id}
+    mgr.delete_session(s1.session_id)
+    assert mgr.list_sessions() == [s2.session_id]
+
+
+def test_list_session_summaries_reuses_cache_until_state_changes(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    state = mgr.create_session()
+
+    load_calls: list[str] = []
+    original_load_state = mgr.load_state
+
+    def counting_load_state(session_id: str):
+        load_calls.append(session_id)
+        return original_load_state(session_id)
+
+    monkeypatch.setattr(mgr, "load_state", counting_load_state)
+
+    assert [summary.session_id for summary in mgr.list_session_summaries()] == [state.session_id]
+    assert [summary.session_id for summary in mgr.list_session_summaries()] == [state.session_id]
+    assert load_calls == [state.session_id]
+
+    state.title = "Renamed"
+    mgr.save_state(state)
+    assert [summary.title for summary in mgr.list_session_summaries()] == ["Renamed"]
+    assert load_calls == [state.session_id, state.session_id]
+
+    mgr.delete_session(state.session_id)
+    assert mgr.list_session_summaries() == []
+
+
+def test_load_state_reuses_parsed_state_until_file_changes(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    state = mgr.create_session()
+
+    def fail_safe_load(_stream):
+        raise AssertionError("state.yaml should not be re-parsed")
+
+    monkeypatch.setattr(manager_mod.yaml_io, "safe_load", fail_safe_load)
+    first = mgr.load_state(state.session_id)
+    second = mgr.load_state(state.session_id)
+    assert first is not None and second is not None
+    assert first is not second
+    first.title = "mutated copy"
+    assert mgr.load_state(state.session_id).title is None
+
+    monkeypatch.undo()
+    state_path = mgr.sessions_dir / state.session_id / "state.yaml"
+    state_path.write_text(state_path.read_text().replace("title: null", "title: Edited on disk"))
+    assert mgr.load_state(state.session_id).title == "Edited on disk"
+
+
+def test_load_state_does_not_cache_data_made_stale_by_a_concurrent_save(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    state = mgr.create_session()
+    mgr._states.clear()
+    real_safe_load = manager_mod.yaml_io.safe_load
+
+    def safe_load_racing_a_save(stream):
+        # Simulate the event loop saving while a worker thread parses the previous version.
+        monkeypatch.setattr(manager_mod.yaml_io, "safe_load", real_safe_load)
+        renamed = state.model_copy(update={"title": "Renamed"})
+        mgr.save_state(renamed)
+        return real_safe_load(stream)
+
+    monkeypatch.setattr(manager_mod.yaml_io, "safe_load", safe_load_racing_a_save)
+    assert mgr.load_state(state.session_id).title is None
+    assert mgr._states[state.session_id][1]["title"] == "Renamed"
+    assert mgr.load_state(state.session_id).title == "Renamed"
+
+
+def test_load_history_reuses_parsed_history_until_file_changes(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    sid = mgr.create_session().session_id
+    mgr.save_history(sid, [ModelRequest(parts=[UserPromptPart(content="hello")])])
+
+    def fail_safe_load(_stream):
+        raise AssertionError("history.yaml should not be re-parsed")
+
+    monkeypatch.setattr(manager_mod.yaml_io, "safe_load", fail_safe_load)
+    first = mgr.load_history(sid)
+    second = mgr.load_history(sid)
+    assert first == second
+    assert first[0] is not second[0]
+
+    monkeypatch.undo()
+    history_path = mgr.sessions_dir / sid / "history.yaml"
+    history_path.write_text(history_path.read_text().replace("hello", "edited on disk"))
+    message = mgr.load_history(sid)[0]
+    assert isinstance(message, ModelRequest)
+    assert message.parts[0].content == "edited on disk"
+
+
+def test_parsed_state_and_history_caches_are_bounded(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(manager_mod, "_PARSED_CACHE_SIZE", 2)
+    mgr = SessionManager(tmp_path)
+    sids = [mgr.create_session().session_id for _ in range(3)]
+    for sid in sids:
+        mgr.save_history(sid, [ModelRequest(parts=[UserPromptPart(content=sid)])])
+    assert list(mgr._states) == sids[1:]
+    assert list(mgr._histories) == sids[1:]
+
+    # A lookup refreshes recency, so the least recently used session is evicted next.
+    assert mgr.load_state(sids[1]) is not None
+    assert mgr.load_history(sids[0])[0].parts[0].content == sids[0]
+    assert list(mgr._histories) == [sids[2], sids[0]]
+    assert list(mgr._states) == [sids[2], sids[1]]
+
+
+def test_save_history_appends_new_messages_and_rewrites_on_rewind(tmp_path: Path):
+    mgr = SessionManager(tmp_path)
+    sid = mgr.create_session().session_id
+    history_path = mgr.sessions_dir / sid / "history.yaml"
+    first = ModelRequest(parts=[UserPromptPart(content="first")])
+    second = ModelRequest(parts=[UserPromptPart(content="second")])
+
+    mgr.save_history(sid, [first])
+    before = history_path.read_text()
+    mgr.save_history(sid, [first, second])
+    assert history_path.read_text().startswith(before)
+    assert [m.parts[0].content for m in SessionManager(tmp_path).load_history(sid)] == ["first", "second"]
+
+    mgr.save_history(sid, [second])
+    assert [m.parts[0].content for m in SessionManager(tmp_path).load_history(sid)] == ["second"]
+
+
+def test_load_history_recovers_from_a_torn_append(tmp_path: Path):
+    mgr = SessionManager(tmp_path)
+    sid = mgr.create_session().session_id
+    history_path = mgr.sessions_dir / sid / "history.yaml"
+    first = ModelRequest(parts=[UserPromptPart(content="first")])
+    second = ModelRequest(parts=[UserPromptPart(content="second")])
+    mgr.save_history(sid, [first])
+    complete = history_path.read_bytes()
+    mgr.save_history(sid, [first, second])
+    # Simulate a crash after the first few bytes of the second batch hit the disk.
+    history_path.write_bytes(history_path.read_bytes()[: len(complete) + 20])
+
+    fresh = SessionManager(tmp_path)
+    assert [m.parts[0].content for m in fresh.load_history(sid)] == ["first"]
+    fresh.save_history(sid, [first, second])
+    assert history_path.read_text().count(manager_mod._HISTORY_BATCH_END) == 1
+    assert [m.parts[0].content for m in SessionManager(tmp_path).load_history(sid)] == ["first", "second"]
+
+
+def test_failed_history_append_falls_back_to_a_rewrite(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    sid = mgr.create_session().session_id
+    history_path = mgr.sessions_dir / sid / "history.yaml"
+    first = ModelRequest(parts=[UserPromptPart(content="first")])
+    second = ModelRequest(parts=[UserPromptPart(content="second")])
+    mgr.save_history(sid, [first])
+
+    def fail_fsync(_fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager_mod.os, "fsync", fail_fsync)
+    mgr.save_history(sid, [first, second])
+    assert history_path.read_text().count(manager_mod._HISTORY_BATCH_END) == 1
+    assert [m.parts[0].content for m in SessionManager(tmp_path).load_history(sid)] == ["first", "second"]
+
+
+def test_load_history_reads_legacy_json_once(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    sid = mgr.create_session().session_id
+    json_path = mgr.sessions_dir / sid / "history.json"
+    json_path.write_bytes(ModelMessagesTypeAdapter.dump_json([ModelRequest(parts=[UserPromptPart(content="legacy")])]))
+    assert mgr.load_history(sid)[0].parts[0].content == "legacy"
+
+    def fail_loads(_data):
+        raise AssertionError("history.json should not be re-parsed")
+
+    monkeypatch.setattr(manager_mod.json, "loads", fail_loads)
+    assert mgr.load_history(sid)[0].parts[0].content == "legacy"
+
+
+def test_count_chat_messages_tracks_appends_without_reparsing(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    sid = mgr.create_session().session_id
+    assert mgr.count_chat_messages(sid) is None
+
+    mgr.append_events(sid, [{"role": "user", "content": "hi"}, {"role": "command", "command": "help", "data": {}}])
+    assert mgr.count_chat_messages(sid) == 1
+
+    def fail_safe_load_all(_stream):
+        raise AssertionError("events.yaml should not be re-parsed")
+
+    monkeypatch.setattr(manager_mod.yaml_io, "safe_load_all", fail_safe_load_all)
+    mgr.append_events(sid, [{"role": "assistant", "content": "hello"}])
+    assert mgr.count_chat_messages(sid) == 2
+
+    mgr.save_events(sid, [{"role": "user", "content": "hi"}])
+    assert mgr.count_chat_messages(sid) == 1
+
+
+def test_count_chat_messages_scans_events_file_without_parsing(tmp_path: Path, monkeypatch):
+    writer = SessionManager(tmp_path)
+    sid = writer.create_session().session_id
+    writer.append_events(
+        sid,
+        [
+            {"role": "user", "content": "first line\nrole: user\nrole: assistant"},
+            {"role": "assistant", "content": "role: user"},
+            {"role": "tool_call", "tool": "exec", "args": {"role": "user"}},
+            {"role": "user", "content": "again"},
+        ],
+    )
+
+    def fail_safe_load_all(_stream):
+        raise AssertionError("events.yaml should not be parsed for counting")
+
+    monkeypatch.setattr(manager_mod.yaml_io, "safe_load_all", fail_safe_load_all)
+    assert SessionManager(tmp_path).count_chat_messages(sid) == 3
+
+
+def test_count_chat_messages_scan_agrees_with_parse_for_adversarial_content(tmp_path: Path, monkeypatch):
+    writer = SessionManager(tmp_path)
+    sid = writer.create_session().session_id
+    tricky = [
+        "x\nrole: user\n",
+        "\nrole: assistant\n",
+        "  leading\nrole: user\n  ",
+        "trailing \nrole: user\n",
+        "\trole: user\n",
+        "---\nrole: user\n---\n",
+        "a" * 200 + "\nrole: user\n" + "b " * 100,
+        "é\x85role: user\u2028role: user\n",
+    ]
+    events: list[dict[str, Any]] = []
+    for content in tricky:
+        events.append({"role": "user", "content": content})
+        events.append({"role": "tool_result", "tool": "exec", "result": content})
+        events.append({"role": "command", "command": "help", "data": [{"role": "user", "content": content}]})
+    writer.append_events(sid, events[:10])
+    writer.append_events(sid, events[10:])
+    expected = sum(1 for event in writer.load_events(sid) if event.get("role") in ("user", "assistant"))
+    assert expected == len(tricky)
+
+    def fail_safe_load_all(_stream):
+        raise AssertionError("events.yaml written by SessionManager should be counted without parsing")
+
+    monkeypatch.setattr(manager_mod.yaml_io, "safe_load_all", fail_safe_load_all)
+    assert SessionManager(tmp_path).count_chat_messages(sid) == expected
+
+
+def test_count_chat_messages_parses_events_not_written_by_the_manager(tmp_path: Path):
+    mgr = SessionManager(tmp_path)
+    sid = mgr.create_session().session_id
+    events_path = mgr.sessions_dir / sid / "events.yaml"
+    # Hand-edited / legacy layout: quoted and flow-style roles the byte scan would miss or miscount.
+    events_path.write_text(
+        "---\n"
+        'role: "user"\n'
+        "content: hi\n"
+        "---\n"
+        "{role: assistant, content: hello}\n"
+        "---\n"
+        "role:   user  # extra spacing\n"
+        "---\n"
+        "role: assistant\n"
+        "content: bye\n"
+    )
+    assert mgr.count_chat_messages(sid) == 4
+
+    mgr.append_events(sid, [{"role": "user", "content": "appended"}])
+    assert SessionManager(tmp_path).count_chat_messages(sid) == 5
+
+
 def test_save_and_resume_state(tmp_path: Path):
     mgr = SessionManager(tmp_path)
     state = mgr.create_session()
@@ -124,6 +413,29 @@ def test_session_manager_calls_on_change_for_state_mutations(tmp_path: Path) ->
     assert changed == ["changed", "changed", "changed"]
 
 
+def test_commit_turn_persists_everything_with_one_change_notification(tmp_path: Path) -> None:
+    changed: list[str] = []
+    mgr = SessionManager(tmp_path, on_change=lambda: changed.append("changed"))
+    state = mgr.create_session()
+    changed.clear()
+
+    state.title = "After turn"
+    tracker = UsageTracker()
+    tracker.record_tool_call()
+    mgr.commit_turn(
+        state,
+        history=[],
+        usage=tracker,
+        llm_request_log=LlmRequestLog(),
+        events=[{"role": "assistant", "content": "done"}],
+    )
+
+    assert changed == ["changed"]
+    assert mgr.load_state(state.session_id).title == "After turn"
+    assert mgr.load_usage(state.session_id).tool_calls == 1
+    assert [event["content"] for event in mgr.load_events(state.session_id)] == ["done"]
+
+
 def test_save_and_load_llm_request_state(tmp_path: Path) -> None:
     mgr = SessionManager(tmp_path)
     state = mgr.create_session()
@@ -191,3 +503,50 @@ def test_missing_user_escalation_callback_denies() -> None:
     security = SessionSecurity("session-1")
     result = asyncio.run(security.escalate_to_user("example.com", {"kind": "domain_access"}))
     assert result == UserEscalationDecision(allowed=False)
+
+
+def test_save_state_replaces_file_atomically(tmp_path: Path):
+    mgr = SessionManager(tmp_path)
+    state = mgr.create_session()
+    state_path = mgr.sessions_dir / state.session_id / "state.yaml"
+    inode = state_path.stat().st_ino
+    state.title = "Renamed"
+    mgr.save_state(state)
+    assert state_path.stat().st_ino != inode
+    assert not list(state_path.parent.glob("*.tmp"))
+    assert SessionManager(tmp_path).load_state(state.session_id).title == "Renamed"
+
+
+def test_failed_state_write_keeps_previous_file_and_removes_temp(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    state = mgr.create_session()
+    state_path = mgr.sessions_dir / state.session_id / "state.yaml"
+    before = state_path.read_bytes()
+
+    def fail_dump(*_args, **_kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(yaml_io, "dump", fail_dump)
+    state.title = "Renamed"
+    with pytest.raises(OSError, match="disk full"):
+        mgr.save_state(state)
+    assert state_path.read_bytes() == before
+    assert not list(state_path.parent.glob("*.tmp"))
+
+
+def test_repeated_saves_skip_mkdir_for_known_session_dir(tmp_path: Path, monkeypatch):
+    mgr = SessionManager(tmp_path)
+    state = mgr.create_session()
+
+    def fail_mkdir(self, *args, **kwargs):
+        raise AssertionError(f"unexpected mkdir for {self}")
+
+    monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+    mgr.save_state(state)
+    mgr.save_history(state.session_id, [ModelRequest(parts=[UserPromptPart(content="hi")])])
+    mgr.append_events(state.session_id, [{"role": "user", "content": "hi"}])
+
+    monkeypatch.undo()
+    assert mgr.delete_session(state.session_id)
+    mgr.save_state(state)
+    assert mgr.load_state(state.session_id) is not None
@@ -1,14 +1,18 @@
 """Tests for SkillRegistry (no LLM tokens needed)."""
 
+import os
 from pathlib import Path
 
+import pytest
+
+import carapace.skills as skills_mod
 from carapace.skills import SkillRegistry
 
 
 def test_scan_empty(tmp_path: Path):
     registry = SkillRegistry(tmp_path / "skills")
     catalog = registry.scan()
-    assert catalog == []
+    assert catalog == ()
 
 
 def test_scan_finds_skill(tmp_path: Path):
@@ -47,7 +51,95 @@ def test_get_full_instructions_missing(tmp_path: Path):
 
 
 def test_scan_caches(tmp_path: Path):
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text("---\nname: my-skill\n---\n")
     registry = SkillRegistry(tmp_path)
     cat1 = registry.scan()
     cat2 = registry.scan()
+    assert isinstance(cat1, tuple)
     assert cat1 is cat2
+
+
+def test_rescan_reuses_frontmatter_until_skill_md_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: my-skill\ndescription: First\n---\nBody.\n")
+    assert SkillRegistry(tmp_path).scan()[0].description == "First"
+
+    # Count frontmatter reads rather than YAML loads: flat frontmatter like this skips YAML entirely.
+    parses = 0
+    real_read_block = skills_mod._read_frontmatter_block
+
+    def counting_read_block(skill_md: Path) -> str | None:
+        nonlocal parses
+        parses += 1
+        return real_read_block(skill_md)
+
+    monkeypatch.setattr(skills_mod, "_read_frontmatter_block", counting_read_block)
+    assert SkillRegistry(tmp_path).scan()[0].description == "First"
+    assert parses == 0
+
+    skill_md.write_text("---\nname: my-skill\ndescription: Second, longer\n---\nBody.\n")
+    stat = skill_md.stat()
+    os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert SkillRegistry(tmp_path).scan()[0].description == "Second, longer"
+    assert parses == 1
+
+
+def test_scan_parses_frontmatter_longer_than_one_read_chunk(tmp_path: Path):
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    description = "x" * 5000
+    (skill_dir / "SKILL.md").write_text(f"---\nname: my-skill\ndescription: {description}\n---\n" + "Body.\n" * 2000)
+    catalog = SkillRegistry(tmp_path).scan()
+    assert catalog[0].description == description
+
+
+def test_scan_skips_entries_without_skill_md(tmp_path: Path):
+    (tmp_path / "not-a-skill").mkdir()
+    (tmp_path / "README.md").write_text("Not a skill directory.\n")
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text("---\nname: my-skill\n---\n")
+    catalog = SkillRegistry(tmp_path).scan()
+    assert [info.name for info in catalog] == ["my-skill"]
+
+
+def test_get_full_instructions_rereads_only_after_change(tmp_path: Path):
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: my-skill\n---\nOld.\n")
+    registry = SkillRegistry(tmp_path)
+    first = registry.get_full_instructions("my-skill")
+    assert registry.get_full_instructions("my-skill") is first
+
+    skill_md.write_text("---\nname: my-skill\n---\nNew body.\n")
+    assert registry.get_full_instructions("my-skill") == "---\nname: my-skill\n---\nNew body.\n"
+
+
+def test_flat_frontmatter_skips_yaml_but_nested_metadata_uses_it(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    flat_dir = tmp_path / "flat"
+    flat_dir.mkdir()
+    (flat_dir / "SKILL.md").write_text("---\nname: flat\ndescription: Plain text, nothing fancy.\n---\n")
+    nested_dir = tmp_path / "nested"
+    nested_dir.mkdir()
+    (nested_dir / "SKILL.md").write_text("---\nname: nested\ndescription: 'Quoted: yes'\nmetadata:\n  a: 1\n---\n")
+
+    parsed: list[str] = []
+    real_safe_load = skills_mod.yaml_io.safe_load
+
+    def recording_safe_load(text: str):
+        parsed.append(text)
+        return real_safe_load(text)
+
+    monkeypatch.setattr(skills_mod.yaml_io, "safe_load", recording_safe_load)
+    catalog = SkillRegistry(tmp_path).scan()
+    assert [(info.name, info.description) for info in catalog] == [
+        ("flat", "Plain text, nothing fancy."),
+        ("nested", "Quoted: yes"),
+    ]
+    assert len(parsed) == 1
+    assert "nested" in parsed[0]